@@ -1,51 +1,106 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import ValidationError
 from ruamel.yaml import YAML
 
-from tick.core.cache import ChecklistCache, FileFingerprint, fingerprint_path
+from tick.core.cache import ChecklistCache, FileFingerprint, fingerprint_bytes
 from tick.core.models.checklist import Checklist, ChecklistDocument
+from tick.core.protocols import ChecklistLoader
+from tick.core.utils import BinaryOpener, open_binary
 from tick.core.validator import ValidationIssue, validate_payload
 
 
-class YamlChecklistLoader:
-    def __init__(self, cache: ChecklistCache | None = None) -> None:
-        self._yaml = YAML(typ="safe")
+def safe_yaml() -> YAML:
+    """Return a safe-mode YAML instance.
+
+    ruamel selects the libyaml C parser automatically when ``ruamel.yaml.clib`` is installed.
+    """
+    return YAML(typ="safe")
+
+
+_yaml = safe_yaml()
+
+
+@dataclass(frozen=True)
+class _CompiledChecklist:
+    """Parse and validation output shared by identical bytes; never handed to callers."""
+
+    raw: dict[str, object]
+    issues: tuple[ValidationIssue, ...]
+    _unclaimed: list[ChecklistDocument] = field(default_factory=list, compare=False, repr=False)
+
+    def document(self) -> ChecklistDocument:
+        """Return the document built during validation once, then a fresh one per call."""
+        try:
+            return self._unclaimed.pop()
+        except IndexError:
+            return ChecklistDocument.from_raw(self.raw)
+
+
+def _parse_bytes(data: bytes) -> dict[str, object]:
+    text = data.decode("utf-8")
+    parsed = _yaml.load(text)
+    if not isinstance(parsed, dict):
+        raise ValueError("Checklist YAML must be a mapping at the top level.")
+    return parsed
+
+
+def _compile_uncached(data: bytes) -> _CompiledChecklist:
+    raw = _parse_bytes(data)
+    issues = validate_payload(raw)
+    if issues:
+        return _CompiledChecklist(raw=raw, issues=tuple(issues))
+    try:
+        document = ChecklistDocument.from_raw(raw)
+    except ValidationError as exc:
+        for error in exc.errors():
+            path_str = ".".join(str(part) for part in error.get("loc", ()))
+            issues.append(ValidationIssue(path=path_str, message=error.get("msg", "")))
+        return _CompiledChecklist(raw=raw, issues=tuple(issues))
+    return _CompiledChecklist(raw=raw, issues=(), _unclaimed=[document])
+
+
+@lru_cache(maxsize=64)
+def _compile(data: bytes) -> _CompiledChecklist:
+    """Parse and validate checklist bytes once per process for identical content.
+
+    The first ``load`` takes the document built while validating; later loads build a fresh
+    model from the cached mapping so callers never share a mutable ``Checklist``.
+    """
+    return _compile_uncached(data)
+
+
+class YamlChecklistLoader(ChecklistLoader):
+    def __init__(
+        self,
+        cache: ChecklistCache | None = None,
+        opener: BinaryOpener = open_binary,
+        *,
+        memoize: bool = True,
+    ) -> None:
         self._cache = cache
+        self._opener = opener
+        self._compile: Callable[[bytes], _CompiledChecklist] = (
+            _compile if memoize else _compile_uncached
+        )
 
     def _read_bytes(self, path: Path) -> bytes:
-        return path.read_bytes()
+        with self._opener(path) as handle:
+            return handle.read()
 
-    def _parse_bytes(self, data: bytes) -> dict[str, object]:
-        text = data.decode("utf-8")
-        parsed = self._yaml.load(text)
-        if not isinstance(parsed, dict):
-            raise ValueError("Checklist YAML must be a mapping at the top level.")
-        return parsed
-
-    def _fingerprint(self, path: Path, data: bytes) -> FileFingerprint | None:
+    def _fingerprint(self, data: bytes) -> FileFingerprint | None:
         if not self._cache:
             return None
-        return fingerprint_path(path, data)
-
-    def _validate_raw(self, raw: dict[str, object]) -> list[ValidationIssue]:
-        issues: list[ValidationIssue] = []
-        issues.extend(validate_payload(raw))
-        if issues:
-            return issues
-        try:
-            ChecklistDocument.from_raw(raw)
-        except ValidationError as exc:
-            for error in exc.errors():
-                path_str = ".".join(str(part) for part in error.get("loc", ()))
-                issues.append(ValidationIssue(path=path_str, message=error.get("msg", "")))
-        return issues
+        return fingerprint_bytes(data)
 
     def validate(self, path: Path) -> list[ValidationIssue]:
         data = self._read_bytes(path)
-        fingerprint = self._fingerprint(path, data)
+        fingerprint = self._fingerprint(data)
         if self._cache and fingerprint:
             cached = self._cache.read_checklist_entry(fingerprint)
             if cached is not None:
@@ -53,19 +108,19 @@ class YamlChecklistLoader:
                     ValidationIssue(path=issue.path, message=issue.message)
                     for issue in cached.issues
                 ]
-        raw = self._parse_bytes(data)
-        issues = self._validate_raw(raw)
+        compiled = self._compile(data)
+        issues = list(compiled.issues)
         if self._cache and fingerprint:
             self._cache.write_checklist_entry(
                 fingerprint=fingerprint,
-                raw=raw if not issues else None,
+                raw=compiled.raw if not issues else None,
                 issues=issues,
             )
         return issues
 
     def load(self, path: Path) -> Checklist:
         data = self._read_bytes(path)
-        fingerprint = self._fingerprint(path, data)
+        fingerprint = self._fingerprint(data)
         if self._cache and fingerprint:
             cached = self._cache.read_checklist_entry(fingerprint)
             if cached is not None and cached.raw is not None and not cached.issues:
@@ -74,14 +129,12 @@ class YamlChecklistLoader:
             if cached is not None and cached.issues:
                 formatted = "; ".join(f"{issue.path}: {issue.message}" for issue in cached.issues)
                 raise ValueError(f"Checklist validation failed: {formatted}")
-        raw = self._parse_bytes(data)
-        issues = self._validate_raw(raw)
-        if issues:
-            formatted = "; ".join(f"{issue.path}: {issue.message}" for issue in issues)
+        compiled = self._compile(data)
+        if compiled.issues:
+            formatted = "; ".join(f"{issue.path}: {issue.message}" for issue in compiled.issues)
             if self._cache and fingerprint:
-                self._cache.write_checklist_entry(fingerprint, None, issues)
+                self._cache.write_checklist_entry(fingerprint, None, list(compiled.issues))
             raise ValueError(f"Checklist validation failed: {formatted}")
-        document = ChecklistDocument.from_raw(raw)
         if self._cache and fingerprint:
-            self._cache.write_checklist_entry(fingerprint, raw, [])
-        return document.checklist
+            self._cache.write_checklist_entry(fingerprint, compiled.raw, [])
+        return compiled.document().checklist
@@ -16,6 +16,7 @@ from tick.core.models.session import Session
 class HtmlReporter(ReporterBase):
     content_type = "text/html"
     file_extension = "html"
+    _env = Environment(autoescape=select_autoescape())
 
     def __init__(self, template_path: Path | None = None) -> None:
         """Initialize the HTML reporter.
@@ -25,6 +26,7 @@ class HtmlReporter(ReporterBase):
                           If None, uses the built-in template.
         """
         self._custom_template_path = template_path
+        self._custom_template: Template | None = None
 
     @staticmethod
     @lru_cache(maxsize=1)
@@ -35,15 +37,15 @@ class HtmlReporter(ReporterBase):
             .joinpath("report.html.j2")
             .read_text(encoding="utf-8")
         )
-        env = Environment(autoescape=select_autoescape())
-        return env.from_string(template_text)
+        return HtmlReporter._env.from_string(template_text)
 
     def _get_template(self) -> Template:
         """Get the template to use (custom or default)."""
         if self._custom_template_path:
-            template_text = self._custom_template_path.read_text(encoding="utf-8")
-            env = Environment(autoescape=select_autoescape())
-            return env.from_string(template_text)
+            if self._custom_template is None:
+                template_text = self._custom_template_path.read_text(encoding="utf-8")
+                self._custom_template = self._env.from_string(template_text)
+            return self._custom_template
         return self._default_template()
 
     def generate(self, session: Session, checklist: Checklist) -> bytes:
@@ -11,9 +11,7 @@ from tick.core.models.session import Session
 class JsonReporter(ReporterBase):
     content_type = "application/json"
     file_extension = "json"
-
-    def __init__(self) -> None:
-        self._encoder = msgspec.json.Encoder()
+    _encoder = msgspec.json.Encoder()
 
     def generate(self, session: Session, checklist: Checklist) -> bytes:
         stats = compute_stats(list(session.responses))
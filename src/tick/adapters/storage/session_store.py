@@ -11,8 +11,15 @@ import msgspec
 from msgspec import DecodeError
 
 from tick.core.models.enums import SessionStatus
-from tick.core.models.session import Session, SessionSummary, decode_session, encode_session
-from tick.core.utils import atomic_write_bytes
+from tick.core.models.session import (
+    Response,
+    Session,
+    SessionSummary,
+    decode_session,
+    encode_session,
+)
+from tick.core.protocols import SessionStorage
+from tick.core.utils import BinaryOpener, atomic_write_bytes, open_binary
 
 
 class SessionIndexEntry(msgspec.Struct):
@@ -23,12 +30,26 @@ class SessionIndexEntry(msgspec.Struct):
     updated_at: float
 
 
-class SessionStore:
-    def __init__(self, base_dir: Path) -> None:
+class ResponseJournalEntry(msgspec.Struct, array_like=True):
+    """One appended response; ``index`` is its position in ``Session.responses``."""
+
+    index: int
+    response: Response
+
+
+# Decodes only the header fields of a session file; responses are skipped.
+_summary_decoder = msgspec.json.Decoder(SessionSummary)
+_index_encoder = msgspec.json.Encoder()
+_index_decoder = msgspec.json.Decoder(list[SessionIndexEntry])
+_journal_encoder = msgspec.json.Encoder()
+_journal_decoder = msgspec.json.Decoder(ResponseJournalEntry)
+
+
+class SessionStore(SessionStorage):
+    def __init__(self, base_dir: Path, opener: BinaryOpener = open_binary) -> None:
         self._base_dir = base_dir
+        self._opener = opener
         self._base_dir.mkdir(parents=True, exist_ok=True)
-        self._index_encoder = msgspec.json.Encoder()
-        self._index_decoder = msgspec.json.Decoder(list[SessionIndexEntry])
 
     def _validate_session_id(self, session_id: str) -> str:
         if not re.fullmatch(r"[a-f0-9]{32}", session_id):
@@ -39,6 +60,26 @@ class SessionStore:
         safe_id = self._validate_session_id(session_id)
         return self._base_dir / f"session-{safe_id}.json"
 
+    def _journal_path(self, session_id: str) -> Path:
+        safe_id = self._validate_session_id(session_id)
+        return self._base_dir / f"session-{safe_id}.ndjson"
+
+    def _replay_journal(self, session: Session, journal: Path) -> Session:
+        """Apply responses appended since the last full save."""
+        try:
+            with self._opener(journal) as handle:
+                lines = handle.read().splitlines()
+        except OSError:
+            return session
+        for line in lines:
+            try:
+                entry = _journal_decoder.decode(line)
+            except (DecodeError, ValueError, TypeError):
+                break  # A torn trailing write ends the usable journal.
+            if entry.index == len(session.responses):
+                session.responses.append(entry.response)
+        return session
+
     def _index_path(self) -> Path:
         return self._base_dir / "session-index.json"
 
@@ -47,27 +88,27 @@ class SessionStore:
         if not path.exists():
             return None
         try:
-            entries = self._index_decoder.decode(path.read_bytes())
+            entries = _index_decoder.decode(path.read_bytes())
         except (OSError, DecodeError, ValueError, TypeError):
             return None
         return {entry.id: entry for entry in entries}
 
     def _save_index(self, entries: Iterable[SessionIndexEntry]) -> None:
-        payload = self._index_encoder.encode(list(entries))
+        payload = _index_encoder.encode(list(entries))
         atomic_write_bytes(self._index_path(), payload)
 
     def _scan_sessions(self) -> dict[str, SessionIndexEntry]:
         entries: dict[str, SessionIndexEntry] = {}
         for path in self._base_dir.glob("session-*.json"):
             try:
-                session = decode_session(path.read_bytes())
+                summary = _summary_decoder.decode(path.read_bytes())
             except (OSError, DecodeError, ValueError, TypeError):
                 continue
-            entries[session.id] = SessionIndexEntry(
-                id=session.id,
-                checklist_id=session.checklist_id,
-                status=session.status,
-                started_at=session.started_at,
+            entries[summary.id] = SessionIndexEntry(
+                id=summary.id,
+                checklist_id=summary.checklist_id,
+                status=summary.status,
+                started_at=summary.started_at,
                 updated_at=path.stat().st_mtime,
             )
         return entries
@@ -86,6 +127,33 @@ class SessionStore:
         )
         with contextlib.suppress(OSError):
             self._save_index(entries.values())
+        self._discard_journal(self._journal_path(session.id))
+        return path
+
+    def _discard_journal(self, journal: Path) -> None:
+        """Drop entries folded into the snapshot; raise rather than leave them replayable.
+
+        Replay matches entries by index alone, so stale lines left beside a snapshot with
+        fewer responses (after going back) would be re-applied on the next load.
+        """
+        try:
+            journal.unlink(missing_ok=True)
+        except OSError:
+            with journal.open("r+b") as handle:
+                handle.truncate()
+
+    def append_response(self, session: Session) -> Path:
+        """Append the latest response to the session journal.
+
+        Cheaper than ``save`` for long sessions: only the new response is written.
+        The journal is folded into the session file by the next ``save``.
+        """
+        path = self._journal_path(session.id)
+        entry = ResponseJournalEntry(
+            index=len(session.responses) - 1, response=session.responses[-1]
+        )
+        with path.open("ab") as handle:
+            handle.write(_journal_encoder.encode(entry) + b"\n")
         return path
 
     def load(self, session_id: str) -> Session | None:
@@ -93,19 +161,20 @@ class SessionStore:
             path = self._path_for(session_id)
         except ValueError:
             return None
-        if not path.exists():
-            return None
         try:
-            return decode_session(path.read_bytes())
+            with self._opener(path) as handle:
+                session = decode_session(handle.read())
         except (OSError, DecodeError, ValueError, TypeError):
             return None
+        return self._replay_journal(session, self._journal_path(session_id))
 
     def load_from_path(self, path: Path) -> Session:
         if not path.is_file():
             raise ValueError("Session path must be a file.")
         if not path.name.startswith("session-") or path.suffix.lower() != ".json":
             raise ValueError("Session file name must be session-<id>.json.")
-        return decode_session(path.read_bytes())
+        session = decode_session(path.read_bytes())
+        return self._replay_journal(session, path.with_suffix(".ndjson"))
 
     def list_sessions(self, checklist_id: str) -> list[SessionSummary]:
         entries = self._load_index()
@@ -138,5 +207,13 @@ class SessionStore:
         ]
         if not candidates:
             return None
-        candidates.sort(key=lambda entry: entry.updated_at, reverse=True)
+        candidates.sort(key=self._last_activity, reverse=True)
         return self.load(candidates[0].id)
+
+    def _last_activity(self, entry: SessionIndexEntry) -> float:
+        """Latest of the last full save and the last journaled response."""
+        try:
+            journaled = self._journal_path(entry.id).stat().st_mtime
+        except (OSError, ValueError):
+            return entry.updated_at
+        return max(entry.updated_at, journaled)
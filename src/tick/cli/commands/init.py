@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cache
 from importlib import resources
 from pathlib import Path
 
@@ -10,6 +11,11 @@ from tick.core.utils import atomic_write_bytes
 from tick.templates.registry import template_filename
 
 
+@cache
+def _load_template(filename: str) -> bytes:
+    return resources.files("tick.templates.checklists").joinpath(filename).read_bytes()
+
+
 def init_command(template: str, output: Path | None, overwrite: bool) -> None:
     console = Console()
     template_key = template.lower()
@@ -18,11 +24,7 @@ def init_command(template: str, output: Path | None, overwrite: bool) -> None:
         console.print(f"[red]Unknown template: {template}[/red]")
         raise typer.Exit(code=1)
     try:
-        content = (
-            resources.files("tick.templates.checklists")
-            .joinpath(filename)
-            .read_text(encoding="utf-8")
-        )
+        content = _load_template(filename)
     except OSError as exc:
         console.print(f"[red]Failed to load template: {exc}[/red]")
         raise typer.Exit(code=1) from exc
@@ -34,10 +36,10 @@ def init_command(template: str, output: Path | None, overwrite: bool) -> None:
             console.print("[red]Output file already exists. Use --overwrite to replace.[/red]")
             raise typer.Exit(code=1)
         try:
-            atomic_write_bytes(output, content.encode("utf-8"))
+            atomic_write_bytes(output, content)
         except OSError as exc:
             console.print(f"[red]Failed to write template: {exc}[/red]")
             raise typer.Exit(code=1) from exc
         console.print(f"[green]Wrote template to {output}[/green]")
     else:
-        typer.echo(content)
+        typer.echo(content.decode("utf-8"))
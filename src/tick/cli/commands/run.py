@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -9,10 +9,9 @@ import structlog
 import typer
 from rich.console import Console
 from rich.progress import Progress
-from ruamel.yaml import YAML
 from ruamel.yaml.error import YAMLError
 
-from tick.adapters.loaders.yaml_loader import YamlChecklistLoader
+from tick.adapters.loaders.yaml_loader import YamlChecklistLoader, safe_yaml
 from tick.adapters.storage.session_store import SessionStore
 from tick.cli.ui.prompts import ask_item_response, ask_variables
 from tick.cli.ui.tables import render_summary
@@ -23,14 +22,15 @@ from tick.core.utils import ensure_session_digest, matrix_key, normalize_evidenc
 
 log: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
+_ANSWERS_YAML = safe_yaml()
+
 
 def _load_answers(path: Path | None) -> dict[str, Any]:
     if not path:
         return {}
-    yaml = YAML(typ="safe")
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            data = yaml.load(handle)
+        with path.open("rb") as handle:
+            data = _ANSWERS_YAML.load(handle)
     except (OSError, YAMLError) as exc:
         raise ValueError("Failed to read answers file.") from exc
     if data is None:
@@ -40,24 +40,36 @@ def _load_answers(path: Path | None) -> dict[str, Any]:
     return data
 
 
-def _normalize_responses(data: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
-    responses = data.get("responses", {})
-    normalized: list[dict[str, Any]] = []
-    if isinstance(responses, dict):
-        for item_id, entry in responses.items():
-            if entry is None:
-                entry = {}
-            if isinstance(entry, dict):
-                entry = {**entry, "item_id": item_id}
-                normalized.append(entry)
-    elif isinstance(responses, list):
-        normalized.extend(e for e in responses if isinstance(e, dict) and "item_id" in e)
+def _normalize_response_mapping(responses: dict[Any, Any]) -> dict[str, list[dict[str, Any]]]:
+    # Distinct YAML keys such as 1 and "1" share one string id, so append rather than overwrite.
+    response_map: dict[str, list[dict[str, Any]]] = {}
+    for item_id, entry in responses.items():
+        if entry is None or isinstance(entry, dict):
+            response_map.setdefault(str(item_id), []).append({**(entry or {}), "item_id": item_id})
+    return response_map
+
+
+def _normalize_response_list(responses: list[Any]) -> dict[str, list[dict[str, Any]]]:
     response_map: dict[str, list[dict[str, Any]]] = {}
-    for entry in normalized:
-        response_map.setdefault(str(entry["item_id"]), []).append(entry)
+    for entry in responses:
+        if isinstance(entry, dict) and "item_id" in entry:
+            response_map.setdefault(str(entry["item_id"]), []).append(entry)
     return response_map
 
 
+# The safe YAML loader only produces plain dicts and lists, so exact types suffice.
+_RESPONSE_HANDLERS: dict[type, Callable[[Any], dict[str, list[dict[str, Any]]]]] = {
+    dict: _normalize_response_mapping,
+    list: _normalize_response_list,
+}
+
+
+def _normalize_responses(data: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    responses = data.get("responses", {})
+    handler = _RESPONSE_HANDLERS.get(type(responses))
+    return handler(responses) if handler is not None else {}
+
+
 def _resolve_variables(
     variables: dict[str, Any], specs: dict[str, ChecklistVariable]
 ) -> tuple[dict[str, object], list[str]]:
@@ -79,19 +91,28 @@ def _resolve_variables(
     return normalized, errors
 
 
+_RESULT_ALIASES: dict[str, ItemResult] = {
+    "pass": ItemResult.PASS,
+    "p": ItemResult.PASS,
+    "fail": ItemResult.FAIL,
+    "f": ItemResult.FAIL,
+    "skip": ItemResult.SKIP,
+    "s": ItemResult.SKIP,
+    "na": ItemResult.NOT_APPLICABLE,
+    "n": ItemResult.NOT_APPLICABLE,
+    "not_applicable": ItemResult.NOT_APPLICABLE,
+    "not-applicable": ItemResult.NOT_APPLICABLE,
+}
+
+
 def _parse_result(value: str | None) -> ItemResult:
     if not value:
         return ItemResult.SKIP
-    normalized = value.strip().lower()
-    if normalized in {"pass", "p"}:
-        return ItemResult.PASS
-    if normalized in {"fail", "f"}:
-        return ItemResult.FAIL
-    if normalized in {"skip", "s"}:
-        return ItemResult.SKIP
-    if normalized in {"na", "n", "not_applicable", "not-applicable"}:
-        return ItemResult.NOT_APPLICABLE
-    return ItemResult.SKIP
+    return _RESULT_ALIASES.get(value.strip().lower(), ItemResult.SKIP)
+
+
+def _is_writable(path: Path) -> bool:
+    return os.access(path, os.W_OK)
 
 
 def _ensure_output_dir(output_dir: Path) -> None:
@@ -101,7 +122,7 @@ def _ensure_output_dir(output_dir: Path) -> None:
         raise ValueError("Output directory is not a directory.") from exc
     if not output_dir.is_dir():
         raise ValueError("Output directory is not a directory.")  # pragma: no cover - defensive
-    if not os.access(output_dir, os.W_OK):
+    if not _is_writable(output_dir):
         raise ValueError("Output directory is not writable.")
 
 
@@ -114,7 +135,7 @@ def run_command(
     dry_run: bool = False,
     cache_dir: Path | None = None,
     no_cache: bool = False,
-) -> None:
+) -> Path:
     console = Console()
     log.debug("run_command_start", checklist=str(checklist), output_dir=str(output_dir))
     from tick.core.cache import ChecklistCache
@@ -221,97 +242,107 @@ def run_command(
             raise typer.Exit(code=1) from exc
 
     total = len(engine.state.items)
-    response_map = _normalize_responses(answers_data)
-
     if no_interactive:
+        _run_batch(engine, _normalize_responses(answers_data), console, total)
+    else:
+        _run_interactive(engine, console, total)
+
+    session_path = store.save(engine.state.session)
+    console.print(f"[green]Session saved to {session_path}[/green]")
+    render_summary(engine.state.session, console)
+    return session_path
+
+
+def _run_batch(
+    engine: ExecutionEngine,
+    response_map: dict[str, list[dict[str, Any]]],
+    console: Console,
+    total: int,
+) -> None:
+    with Progress(console=console) as progress:
+        task = progress.add_task(f"Checklist progress (0/{total})", total=total)
+        for item_resolved in engine.state.items[engine.state.current_index :]:
+            entry = None
+            if response_map.get(item_resolved.item.id):
+                if item_resolved.matrix_context:
+                    target = matrix_key(item_resolved.matrix_context)
+                    for idx, candidate in enumerate(response_map[item_resolved.item.id]):
+                        if matrix_key(candidate.get("matrix")) == target:
+                            entry = response_map[item_resolved.item.id].pop(idx)
+                            break
+                else:
+                    entry = response_map[item_resolved.item.id].pop(0)
+            result = _parse_result(entry.get("result") if entry else None)
+            notes = entry.get("notes") if entry else None
+            evidence = normalize_evidence(entry.get("evidence") if entry else None)
+            engine.record_response(
+                item=item_resolved.item,
+                result=result,
+                notes=notes,
+                evidence=evidence or None,
+                matrix_context=item_resolved.matrix_context,
+            )
+            progress.advance(task)
+            progress.update(
+                task,
+                description=f"Checklist progress ({engine.state.current_index}/{total})",
+            )
+    engine.complete()
+    unused = sum(len(entries) for entries in response_map.values())
+    if unused:
+        msg = f"[yellow]Warning: {unused} answer entries did not match any checklist item.[/yellow]"
+        console.print(msg)
+
+
+def _run_interactive(engine: ExecutionEngine, console: Console, total: int) -> None:
+    try:
         with Progress(console=console) as progress:
             task = progress.add_task(f"Checklist progress (0/{total})", total=total)
-            for item_resolved in engine.state.items[engine.state.current_index :]:
-                entry = None
-                if response_map.get(item_resolved.item.id):
-                    if item_resolved.matrix_context:
-                        target = matrix_key(item_resolved.matrix_context)
-                        for idx, candidate in enumerate(response_map[item_resolved.item.id]):
-                            if matrix_key(candidate.get("matrix")) == target:
-                                entry = response_map[item_resolved.item.id].pop(idx)
-                                break
-                    else:
-                        entry = response_map[item_resolved.item.id].pop(0)
-                result = _parse_result(entry.get("result") if entry else None)
-                notes = entry.get("notes") if entry else None
-                evidence = normalize_evidence(entry.get("evidence") if entry else None)
+            while engine.current_item is not None:
+                current = engine.current_item
+                if current is None:
+                    break
+                progress.stop()
+                can_go_back = engine.state.current_index > 0
+                item_result, notes, evidence_iter = ask_item_response(
+                    current, console, can_go_back=can_go_back
+                )
+
+                # Handle back navigation
+                if item_result is None:
+                    engine.go_back()
+                    engine.save()  # Save after going back
+                    idx = engine.state.current_index
+                    progress.update(
+                        task,
+                        completed=idx,
+                        description=f"Checklist progress ({idx}/{total})",
+                    )
+                    progress.start()  # Restart progress before continuing loop
+                    continue
+
+                evidence_list: list[str] | None = list(evidence_iter) if evidence_iter else None
+                progress.start()
                 engine.record_response(
-                    item=item_resolved.item,
-                    result=result,
+                    item=current.item,
+                    result=item_result,
                     notes=notes,
-                    evidence=evidence or None,
-                    matrix_context=item_resolved.matrix_context,
+                    evidence=evidence_list,
+                    matrix_context=current.matrix_context,
                 )
+                engine.append_response()  # Journal each response
                 progress.advance(task)
                 progress.update(
                     task,
                     description=f"Checklist progress ({engine.state.current_index}/{total})",
                 )
         engine.complete()
-        unused = sum(len(entries) for entries in response_map.values())
-        if unused:
-            msg = (
-                f"[yellow]Warning: {unused} answer entries did not match "
-                "any checklist item.[/yellow]"
-            )
-            console.print(msg)
-    else:
-        try:
-            with Progress(console=console) as progress:
-                task = progress.add_task(f"Checklist progress (0/{total})", total=total)
-                while engine.current_item is not None:
-                    current = engine.current_item
-                    if current is None:
-                        break
-                    progress.stop()
-                    can_go_back = engine.state.current_index > 0
-                    item_result, notes, evidence_iter = ask_item_response(
-                        current, console, can_go_back=can_go_back
-                    )
-
-                    # Handle back navigation
-                    if item_result is None:
-                        engine.go_back()
-                        engine.save()  # Save after going back
-                        idx = engine.state.current_index
-                        progress.update(
-                            task,
-                            completed=idx,
-                            description=f"Checklist progress ({idx}/{total})",
-                        )
-                        progress.start()  # Restart progress before continuing loop
-                        continue
-
-                    evidence_list: list[str] | None = list(evidence_iter) if evidence_iter else None
-                    progress.start()
-                    engine.record_response(
-                        item=current.item,
-                        result=item_result,
-                        notes=notes,
-                        evidence=evidence_list,
-                        matrix_context=current.matrix_context,
-                    )
-                    engine.save()  # Auto-save after each response
-                    progress.advance(task)
-                    progress.update(
-                        task,
-                        description=f"Checklist progress ({engine.state.current_index}/{total})",
-                    )
-            engine.complete()
-        except KeyboardInterrupt:
-            # Session already auto-saved after last response
-            completed = len(engine.state.session.responses)
-            console.print(
-                f"\n[yellow]Interrupted. Session saved with {completed}/{total} responses.[/yellow]"
-            )
-            console.print("[yellow]Resume later with --resume[/yellow]")
-            raise typer.Exit(0) from None
-
-    session_path = store.save(engine.state.session)
-    console.print(f"[green]Session saved to {session_path}[/green]")
-    render_summary(engine.state.session, console)
+    except KeyboardInterrupt:
+        # Fold the response journal into the session file before exiting
+        engine.save()
+        completed = len(engine.state.session.responses)
+        console.print(
+            f"\n[yellow]Interrupted. Session saved with {completed}/{total} responses.[/yellow]"
+        )
+        console.print("[yellow]Resume later with --resume[/yellow]")
+        raise typer.Exit(0) from None
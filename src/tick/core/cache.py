@@ -4,8 +4,9 @@ import hashlib
 import json
 import os
 import sys
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from time import time
 
@@ -20,15 +21,13 @@ CACHE_VERSION = 1
 
 @dataclass(frozen=True)
 class FileFingerprint:
-    path: str
-    size: int
-    mtime: float
     sha256: str
 
     @property
     def signature(self) -> str:
-        payload = f"{self.path}|{self.size}|{self.mtime}|{self.sha256}".encode()
-        return hashlib.sha256(payload).hexdigest()
+        # Cached entries depend only on file content, so identical checklists share one entry
+        # regardless of where they live on disk.
+        return self.sha256
 
 
 class CacheIssue(msgspec.Struct, frozen=True):
@@ -61,15 +60,8 @@ class CacheStats(msgspec.Struct, frozen=True):
     total_bytes: int
 
 
-def fingerprint_path(path: Path, data: bytes) -> FileFingerprint:
-    stat = path.stat()
-    digest = hashlib.sha256(data).hexdigest()
-    return FileFingerprint(
-        path=str(path.resolve()),
-        size=stat.st_size,
-        mtime=stat.st_mtime,
-        sha256=digest,
-    )
+def fingerprint_bytes(data: bytes) -> FileFingerprint:
+    return FileFingerprint(sha256=hashlib.sha256(data).hexdigest())
 
 
 def _default_cache_dir() -> Path:
@@ -102,6 +94,15 @@ def _build_item_index(checklist: Checklist) -> dict[str, tuple[ChecklistItem, st
     return mapping
 
 
+def _json_entries(directory: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield cache entry files from one scandir pass; a missing directory yields nothing."""
+    try:
+        with os.scandir(directory) as scan:
+            yield from (entry for entry in scan if entry.name.endswith(".json"))
+    except FileNotFoundError:
+        return
+
+
 class ChecklistCache:
     def __init__(self, cache_dir: Path | None = None) -> None:
         self._cache_dir = cache_dir or _default_cache_dir()
@@ -205,9 +206,9 @@ class ChecklistCache:
             return
 
     def stats(self) -> CacheStats:
-        checklist_entries = list(self._checklists_dir.glob("*.json"))
-        expansion_entries = list(self._expansions_dir.glob("*.json"))
-        total_bytes = sum(path.stat().st_size for path in checklist_entries + expansion_entries)
+        checklist_entries = list(_json_entries(self._checklists_dir))
+        expansion_entries = list(_json_entries(self._expansions_dir))
+        total_bytes = sum(entry.stat().st_size for entry in checklist_entries + expansion_entries)
         return CacheStats(
             checklist_entries=len(checklist_entries),
             expansion_entries=len(expansion_entries),
@@ -222,11 +223,11 @@ class ChecklistCache:
 
     def prune(self, max_age_days: int) -> None:
         cutoff = time() - (max_age_days * 86400)
-        for path in list(self._checklists_dir.glob("*.json")) + list(
-            self._expansions_dir.glob("*.json")
+        for entry in chain(
+            _json_entries(self._checklists_dir), _json_entries(self._expansions_dir)
         ):
             try:
-                if path.stat().st_mtime < cutoff:
-                    path.unlink(missing_ok=True)
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
             except OSError:
                 continue
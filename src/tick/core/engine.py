@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
+from functools import lru_cache
 from uuid import uuid4
 
 import structlog
@@ -23,29 +24,42 @@ from tick.core.utils import (
 log: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
+_ALLOWED_CONDITION_NODES = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Name,
+    ast.Constant,
+    ast.Load,
+    ast.List,
+    ast.Tuple,
+    ast.And,
+    ast.Or,
+    ast.Eq,
+    ast.NotEq,
+    ast.In,
+    ast.NotIn,
+    ast.Not,
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> ast.Expression:
+    """Parse and validate a condition once; the tree is reused for every evaluation."""
+    try:
+        parsed = ast.parse(condition, mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid condition: {condition}") from exc
+    if any(not isinstance(node, _ALLOWED_CONDITION_NODES) for node in ast.walk(parsed)):
+        raise ValueError(f"Unsupported expression in condition: {condition}")
+    return parsed
+
+
 def _safe_eval_condition(condition: str, variables: Mapping[str, object]) -> bool:
     if not condition:
         return True
 
-    allowed_nodes = (
-        ast.Expression,
-        ast.BoolOp,
-        ast.UnaryOp,
-        ast.Compare,
-        ast.Name,
-        ast.Constant,
-        ast.Load,
-        ast.List,
-        ast.Tuple,
-        ast.And,
-        ast.Or,
-        ast.Eq,
-        ast.NotEq,
-        ast.In,
-        ast.NotIn,
-        ast.Not,
-    )
-
     def _eval(node: ast.AST) -> object:
         if isinstance(node, ast.Expression):
             return _eval(node.body)
@@ -88,24 +102,28 @@ def _safe_eval_condition(condition: str, variables: Mapping[str, object]) -> boo
             return [_eval(element) for element in node.elts]
         raise ValueError("Unsupported expression")  # pragma: no cover - defensive
 
-    try:
-        parsed = ast.parse(condition, mode="eval")
-    except SyntaxError as exc:
-        raise ValueError(f"Invalid condition: {condition}") from exc
-    if any(not isinstance(node, allowed_nodes) for node in ast.walk(parsed)):
-        raise ValueError(f"Unsupported expression in condition: {condition}")
-    return bool(_eval(parsed))
+    return bool(_eval(_compile_condition(condition)))
 
 
 def _expand_items(
     checklist: Checklist, variables: Mapping[str, object]
 ) -> tuple[ResolvedItem, ...]:
     resolved: list[ResolvedItem] = []
+    # Conditions only see ``variables``, so each distinct expression is evaluated once per call.
+    outcomes: dict[str, bool] = {}
+
+    def _passes(condition: str | None) -> bool:
+        if not condition:
+            return True
+        if condition not in outcomes:
+            outcomes[condition] = _safe_eval_condition(condition, variables)
+        return outcomes[condition]
+
     for section in checklist.sections:
-        if section.condition and not _safe_eval_condition(section.condition, variables):
+        if not _passes(section.condition):
             continue
         for item in section.items:
-            if item.condition and not _safe_eval_condition(item.condition, variables):
+            if not _passes(item.condition):
                 continue
             if item.matrix:
                 resolved.extend(
@@ -256,3 +274,8 @@ class ExecutionEngine:
     def save(self) -> None:
         self._storage.save(self.state.session)
         log.debug("session_saved", session_id=self.state.session.id)
+
+    def append_response(self) -> None:
+        """Persist only the latest response; ``save`` later compacts it into the session."""
+        self._storage.append_response(self.state.session)
+        log.debug("response_appended", session_id=self.state.session.id)
@@ -16,7 +16,7 @@ def _slugify(value: str) -> str:
 
 
 class ChecklistVariable(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     prompt: str
     required: bool = False
@@ -25,7 +25,7 @@ class ChecklistVariable(BaseModel):
 
 
 class ChecklistMetadata(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     author: str | None = None
     tags: list[str] = Field(default_factory=list)
@@ -33,7 +33,7 @@ class ChecklistMetadata(BaseModel):
 
 
 class ChecklistItem(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     id: str
     check: str
@@ -45,7 +45,7 @@ class ChecklistItem(BaseModel):
 
 
 class ChecklistSection(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     name: str
     condition: str | None = None
@@ -53,7 +53,7 @@ class ChecklistSection(BaseModel):
 
 
 class Checklist(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     name: str
     version: str
@@ -69,8 +69,8 @@ class Checklist(BaseModel):
 
 
 def compute_checklist_digest(checklist: Checklist) -> str:
-    if getattr(checklist, "_digest_cache", None):
-        return checklist._digest_cache  # type: ignore[return-value]
+    if checklist._digest_cache is not None:
+        return checklist._digest_cache
     payload = checklist.model_dump(mode="json")
     normalized = json.dumps(
         payload,
@@ -84,7 +84,7 @@ def compute_checklist_digest(checklist: Checklist) -> str:
 
 
 class ChecklistDocument(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     checklist: Checklist
 
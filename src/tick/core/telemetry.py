@@ -44,24 +44,36 @@ def _state_path() -> Path:
     return _config_dir() / "telemetry-state.json"
 
 
+def _read_bytes(path: Path) -> bytes | None:
+    """Read a telemetry file; ``None`` when it is missing or unreadable."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    """Write a telemetry file; failures are ignored so telemetry never breaks a command."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+    except OSError:
+        return
+
+
 def _load_config() -> TelemetryConfig:
-    path = _config_path()
-    if not path.exists():
+    data = _read_bytes(_config_path())
+    if data is None:
         return TelemetryConfig(enabled=False, updated_at=0.0)
     try:
-        return msgspec.json.decode(path.read_bytes(), type=TelemetryConfig)
-    except (OSError, msgspec.DecodeError, TypeError, ValueError):
+        return msgspec.json.decode(data, type=TelemetryConfig)
+    except (msgspec.DecodeError, TypeError, ValueError):
         return TelemetryConfig(enabled=False, updated_at=0.0)
 
 
 def _save_config(enabled: bool) -> None:
-    path = _config_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
     payload = TelemetryConfig(enabled=enabled, updated_at=time())
-    try:
-        path.write_bytes(msgspec.json.encode(payload))
-    except OSError:
-        return
+    _write_bytes(_config_path(), msgspec.json.encode(payload))
 
 
 def telemetry_enabled() -> bool:
@@ -73,22 +85,17 @@ def set_telemetry_enabled(enabled: bool) -> None:
 
 
 def _load_state() -> TelemetryState:
-    path = _state_path()
-    if not path.exists():
+    data = _read_bytes(_state_path())
+    if data is None:
         return TelemetryState()
     try:
-        return msgspec.json.decode(path.read_bytes(), type=TelemetryState)
-    except (OSError, msgspec.DecodeError, TypeError, ValueError):
+        return msgspec.json.decode(data, type=TelemetryState)
+    except (msgspec.DecodeError, TypeError, ValueError):
         return TelemetryState()
 
 
 def _save_state(state: TelemetryState) -> None:
-    path = _state_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    try:
-        path.write_bytes(msgspec.json.encode(state))
-    except OSError:
-        return
+    _write_bytes(_state_path(), msgspec.json.encode(state))
 
 
 def _bucket_duration(seconds: float) -> str:
@@ -136,7 +143,7 @@ def telemetry_context(command: str) -> Generator[None, None, None]:
         else:
             record_event(command, duration, "typer.Exit")
         raise
-    except Exception as exc:  # pragma: no cover - defensive
+    except Exception as exc:
         duration = perf_counter() - start
         record_event(command, duration, exc.__class__.__name__)
         raise
@@ -3,13 +3,20 @@ from __future__ import annotations
 import contextlib
 import os
 import tempfile
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from typing import BinaryIO
 
 from tick.core.models.checklist import Checklist, compute_checklist_digest
 from tick.core.models.session import Session
 from tick.core.state import ResolvedItem
 
+BinaryOpener = Callable[[Path], BinaryIO]
+
+
+def open_binary(path: Path) -> BinaryIO:
+    return path.open("rb")
+
 
 def matrix_key(matrix: Mapping[str, object] | None) -> tuple[tuple[str, str], ...] | None:
     if matrix is None or not isinstance(matrix, dict):
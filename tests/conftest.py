@@ -1,13 +1,40 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import UTC, datetime
+from pathlib import Path
 
+import msgspec
 import pytest
-from ruamel.yaml import YAML
+from ruamel.yaml.parser import Parser as PurePythonYamlParser
 
-from tick.core.models.checklist import ChecklistDocument
+from tick.adapters.loaders.yaml_loader import safe_yaml
+from tick.core.models.checklist import Checklist, ChecklistDocument
 from tick.core.models.enums import SessionStatus
-from tick.core.models.session import Session
+from tick.core.models.session import Session, encode_session
+from tick.core.perf import PerfResult, run_harness
+
+_MINIMAL_CHECKLIST_YAML = b"""
+checklist:
+  name: "Minimal Checklist"
+  version: "1.0.0"
+  domain: "web"
+  sections:
+    - name: "Basics"
+      items:
+        - id: "item-1"
+          check: "Do the thing"
+""".strip()
+
+
+def _has_c_yaml_parser() -> bool:
+    return safe_yaml().Parser is not PurePythonYamlParser
+
+
+def pytest_report_header() -> str:
+    if _has_c_yaml_parser():
+        return "yaml parser: libyaml (C)"
+    return "yaml parser: pure Python (install ruamel.yaml.clib for faster YAML parsing)"
 
 
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
@@ -30,8 +57,7 @@ def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
             item.add_marker(pytest.mark.e2e)
 
 
-@pytest.fixture
-def minimal_checklist_data() -> dict[str, object]:
+def _minimal_checklist_data() -> dict[str, object]:
     return {
         "checklist": {
             "name": "Minimal Checklist",
@@ -50,12 +76,48 @@ def minimal_checklist_data() -> dict[str, object]:
 
 
 @pytest.fixture
-def minimal_checklist(minimal_checklist_data):
-    return ChecklistDocument.from_raw(minimal_checklist_data).checklist
+def minimal_checklist_data() -> dict[str, object]:
+    return _minimal_checklist_data()
 
 
-@pytest.fixture
-def complex_checklist_data() -> dict[str, object]:
+@pytest.fixture(scope="session")
+def minimal_checklist() -> Checklist:
+    """Shared parsed checklist; tests must treat it as read-only."""
+    return ChecklistDocument.from_raw(_minimal_checklist_data()).checklist
+
+
+@pytest.fixture(scope="session")
+def minimal_checklist_bytes() -> bytes:
+    return _MINIMAL_CHECKLIST_YAML
+
+
+@pytest.fixture(scope="session")
+def minimal_checklist_path(
+    tmp_path_factory: pytest.TempPathFactory, minimal_checklist_bytes: bytes
+) -> Path:
+    """Read-only checklist file shared by every test in the session."""
+    path = tmp_path_factory.mktemp("checklists") / "checklist.yaml"
+    path.write_bytes(minimal_checklist_bytes)
+    return path
+
+
+@pytest.fixture(scope="session")
+def make_session_bytes() -> Callable[..., bytes]:
+    """Build encoded minimal-checklist sessions that differ only in the given fields."""
+    base = Session(
+        id="0" * 32,
+        checklist_id="minimal-checklist-1.0.0",
+        started_at=datetime(2024, 1, 1, tzinfo=UTC),
+        status=SessionStatus.IN_PROGRESS,
+    )
+
+    def build(**overrides: object) -> bytes:
+        return encode_session(msgspec.structs.replace(base, **overrides))
+
+    return build
+
+
+def _complex_checklist_data() -> dict[str, object]:
     return {
         "checklist": {
             "name": "Complex Checklist",
@@ -115,12 +177,18 @@ def complex_checklist_data() -> dict[str, object]:
 
 
 @pytest.fixture
-def complex_checklist(complex_checklist_data):
-    return ChecklistDocument.from_raw(complex_checklist_data).checklist
+def complex_checklist_data() -> dict[str, object]:
+    return _complex_checklist_data()
 
 
-@pytest.fixture
-def large_checklist_path(tmp_path):
+@pytest.fixture(scope="session")
+def complex_checklist() -> Checklist:
+    """Shared parsed checklist; tests must treat it as read-only."""
+    return ChecklistDocument.from_raw(_complex_checklist_data()).checklist
+
+
+@pytest.fixture(scope="session")
+def large_checklist_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     def build_large_checklist(sections: int = 20, items_per_section: int = 25) -> dict[str, object]:
         checklist_sections = []
         for section_index in range(sections):
@@ -148,26 +216,36 @@ def large_checklist_path(tmp_path):
         }
 
     data = build_large_checklist()
-    path = tmp_path / "large-checklist.yaml"
-    yaml = YAML()
+    path = tmp_path_factory.mktemp("perf") / "large-checklist.yaml"
+    yaml = safe_yaml()
     with path.open("w", encoding="utf-8") as handle:
         yaml.dump(data, handle)
     return path
 
 
-@pytest.fixture
-def in_progress_session(minimal_checklist) -> Session:
+@pytest.fixture(scope="session")
+def harness_result(large_checklist_path: Path) -> PerfResult:
+    """One perf-harness run shared by every test that inspects its result."""
+    return run_harness(large_checklist_path)
+
+
+@pytest.fixture(scope="session")
+def _in_progress_session_template(minimal_checklist) -> Session:
     return Session(
         id="session-1",
         checklist_id=minimal_checklist.checklist_id,
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=datetime(2025, 1, 1, tzinfo=UTC),
         status=SessionStatus.IN_PROGRESS,
-        variables={},
-        responses=[],
     )
 
 
+@pytest.fixture
+def in_progress_session(_in_progress_session_template: Session) -> Session:
+    # Tests reassign responses/digest, so each one gets its own struct with fresh containers.
+    return msgspec.structs.replace(_in_progress_session_template, variables={}, responses=[])
+
+
 @pytest.fixture
 def completed_session(minimal_checklist) -> Session:
     return Session(
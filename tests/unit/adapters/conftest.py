@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO
+
+import pytest
+
+from tick.core.utils import BinaryOpener
+
+
+def _memory_opener(files: dict[Path, bytes]) -> BinaryOpener:
+    def _open(path: Path) -> BinaryIO:
+        if path not in files:
+            raise FileNotFoundError(path)
+        return io.BytesIO(files[path])
+
+    return _open
+
+
+@pytest.fixture
+def memory_opener() -> Callable[[dict[Path, bytes]], BinaryOpener]:
+    """Build an opener that serves the given path -> bytes mapping instead of the disk."""
+    return _memory_opener
@@ -13,12 +13,14 @@ from tick.core.models.checklist import ChecklistDocument
 from tick.core.models.enums import ItemResult, SessionStatus
 from tick.core.models.session import Response, Session
 
+_NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
 
 def _make_session(checklist_id: str) -> Session:
     response = Response(
         item_id="item-1",
         result=ItemResult.PASS,
-        answered_at=datetime.now(UTC),
+        answered_at=_NOW,
         notes="ok",
         evidence=("screenshot.png",),
     )
@@ -26,7 +28,7 @@ def _make_session(checklist_id: str) -> Session:
         id="session-1",
         checklist_id=checklist_id,
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=[response],
         variables={},
@@ -36,17 +38,17 @@ def _make_session(checklist_id: str) -> Session:
 def _make_multi_result_session(checklist_id: str) -> Session:
     """Create a session with multiple result types for stats testing."""
     responses = [
-        Response(item_id="item-1", result=ItemResult.PASS, answered_at=datetime.now(UTC)),
-        Response(item_id="item-2", result=ItemResult.PASS, answered_at=datetime.now(UTC)),
-        Response(item_id="item-3", result=ItemResult.FAIL, answered_at=datetime.now(UTC)),
-        Response(item_id="item-4", result=ItemResult.SKIP, answered_at=datetime.now(UTC)),
-        Response(item_id="item-5", result=ItemResult.NOT_APPLICABLE, answered_at=datetime.now(UTC)),
+        Response(item_id="item-1", result=ItemResult.PASS, answered_at=_NOW),
+        Response(item_id="item-2", result=ItemResult.PASS, answered_at=_NOW),
+        Response(item_id="item-3", result=ItemResult.FAIL, answered_at=_NOW),
+        Response(item_id="item-4", result=ItemResult.SKIP, answered_at=_NOW),
+        Response(item_id="item-5", result=ItemResult.NOT_APPLICABLE, answered_at=_NOW),
     ]
     return Session(
         id="session-stats",
         checklist_id=checklist_id,
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=responses,
         variables={"environment": "prod"},
@@ -61,6 +63,17 @@ def test_html_reporter_outputs_content(minimal_checklist):
     assert "item-1" in output
 
 
+def test_html_reporter_reuses_custom_template(minimal_checklist, tmp_path):
+    template_path = tmp_path / "report.html.j2"
+    template_path.write_text("<h1>{{ checklist.name }}</h1>", encoding="utf-8")
+    reporter = HtmlReporter(template_path=template_path)
+    session = _make_session(minimal_checklist.checklist_id)
+    first = reporter.generate(session, minimal_checklist)
+    template_path.unlink()
+    second = reporter.generate(session, minimal_checklist)
+    assert first == second == b"<h1>Minimal Checklist</h1>"
+
+
 def test_markdown_reporter_outputs_table(minimal_checklist):
     reporter = MarkdownReporter()
     session = _make_session(minimal_checklist.checklist_id)
@@ -74,7 +87,7 @@ def test_markdown_reporter_escapes_cells_and_matrix(minimal_checklist):
     response = Response(
         item_id="item-1",
         result=ItemResult.FAIL,
-        answered_at=datetime.now(UTC),
+        answered_at=_NOW,
         notes="line1\nline2 | note",
         matrix_context={"role": "admin"},
     )
@@ -82,7 +95,7 @@ def test_markdown_reporter_escapes_cells_and_matrix(minimal_checklist):
         id="session-2",
         checklist_id=minimal_checklist.checklist_id,
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=[response],
         variables={},
@@ -104,11 +117,11 @@ def test_json_reporter_emits_payload(minimal_checklist):
 def test_compute_stats_counts_results():
     """Verify compute_stats correctly counts each result type."""
     responses = [
-        Response(item_id="a", result=ItemResult.PASS, answered_at=datetime.now(UTC)),
-        Response(item_id="b", result=ItemResult.PASS, answered_at=datetime.now(UTC)),
-        Response(item_id="c", result=ItemResult.FAIL, answered_at=datetime.now(UTC)),
-        Response(item_id="d", result=ItemResult.SKIP, answered_at=datetime.now(UTC)),
-        Response(item_id="e", result=ItemResult.NOT_APPLICABLE, answered_at=datetime.now(UTC)),
+        Response(item_id="a", result=ItemResult.PASS, answered_at=_NOW),
+        Response(item_id="b", result=ItemResult.PASS, answered_at=_NOW),
+        Response(item_id="c", result=ItemResult.FAIL, answered_at=_NOW),
+        Response(item_id="d", result=ItemResult.SKIP, answered_at=_NOW),
+        Response(item_id="e", result=ItemResult.NOT_APPLICABLE, answered_at=_NOW),
     ]
     stats = compute_stats(responses)
     assert stats["pass"] == 2
@@ -193,14 +206,14 @@ def test_json_reporter_includes_stats(minimal_checklist):
 
 def test_ordered_responses_append_unmatched(minimal_checklist):
     responses = [
-        Response(item_id="item-1", result=ItemResult.PASS, answered_at=datetime.now(UTC)),
-        Response(item_id="extra-1", result=ItemResult.FAIL, answered_at=datetime.now(UTC)),
+        Response(item_id="item-1", result=ItemResult.PASS, answered_at=_NOW),
+        Response(item_id="extra-1", result=ItemResult.FAIL, answered_at=_NOW),
     ]
     session = Session(
         id="session-order",
         checklist_id=minimal_checklist.checklist_id,
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=responses,
         variables={},
@@ -228,14 +241,14 @@ def test_ordered_responses_respects_resolved_items():
     }
     checklist = ChecklistDocument.from_raw(raw).checklist
     responses = [
-        Response(item_id="item-1", result=ItemResult.PASS, answered_at=datetime.now(UTC)),
-        Response(item_id="item-2", result=ItemResult.FAIL, answered_at=datetime.now(UTC)),
+        Response(item_id="item-1", result=ItemResult.PASS, answered_at=_NOW),
+        Response(item_id="item-2", result=ItemResult.FAIL, answered_at=_NOW),
     ]
     session = Session(
         id="session-resolved",
         checklist_id=checklist.checklist_id,
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=responses,
         variables={},
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-import time
+import os
 from datetime import UTC, datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 import msgspec
+import pytest
 
 from tick.adapters.storage import session_store as session_store_module
 from tick.adapters.storage.session_store import SessionStore
-from tick.core.models.enums import SessionStatus
-from tick.core.models.session import Session
+from tick.core.models.enums import ItemResult, SessionStatus
+from tick.core.models.session import Response, Session, encode_session
+
+_NOW = datetime(2025, 1, 1, tzinfo=UTC)
 
 
 def _session_id(seed: int) -> str:
@@ -21,7 +25,7 @@ def _make_session(session_id: str, checklist_id: str, status: SessionStatus) ->
         id=session_id,
         checklist_id=checklist_id,
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         completed_at=None,
         status=status,
         variables={},
@@ -29,6 +33,33 @@ def _make_session(session_id: str, checklist_id: str, status: SessionStatus) ->
     )
 
 
+_BLOB_SESSION_ID = _session_id(0)
+_BLOB_CHECKLIST_ID = "blob-checklist"
+
+
+@pytest.fixture(scope="module")
+def session_blob() -> bytes:
+    return encode_session(
+        _make_session(_BLOB_SESSION_ID, _BLOB_CHECKLIST_ID, SessionStatus.IN_PROGRESS)
+    )
+
+
+def _write_session_blob(
+    directory: Path, blob: bytes, session_id: str, checklist_id: str, status: SessionStatus
+) -> Path:
+    data = (
+        blob.replace(f'"id":"{_BLOB_SESSION_ID}"'.encode(), f'"id":"{session_id}"'.encode())
+        .replace(
+            f'"checklist_id":"{_BLOB_CHECKLIST_ID}"'.encode(),
+            f'"checklist_id":"{checklist_id}"'.encode(),
+        )
+        .replace(b'"status":"in_progress"', f'"status":"{status.value}"'.encode())
+    )
+    path = directory / f"session-{session_id}.json"
+    path.write_bytes(data)
+    return path
+
+
 def test_session_store_save_load(tmp_path: Path):
     store = SessionStore(tmp_path)
     session = _make_session(_session_id(1), "check-1", SessionStatus.IN_PROGRESS)
@@ -39,20 +70,19 @@ def test_session_store_save_load(tmp_path: Path):
     assert loaded.id == _session_id(1)
 
 
-def test_session_store_load_missing_returns_none(tmp_path: Path):
-    store = SessionStore(tmp_path)
+def test_session_store_load_missing_returns_none(tmp_path: Path, memory_opener):
+    store = SessionStore(tmp_path, opener=memory_opener({}))
     assert store.load(_session_id(2)) is None
 
 
-def test_session_store_load_invalid_id_returns_none(tmp_path: Path):
-    store = SessionStore(tmp_path)
+def test_session_store_load_invalid_id_returns_none(tmp_path: Path, memory_opener):
+    store = SessionStore(tmp_path, opener=memory_opener({}))
     assert store.load("bad-id") is None
 
 
-def test_session_store_load_corrupt_returns_none(tmp_path: Path):
-    store = SessionStore(tmp_path)
-    corrupt_path = tmp_path / "session-bad.json"
-    corrupt_path.write_text("not-json", encoding="utf-8")
+def test_session_store_load_corrupt_returns_none(tmp_path: Path, memory_opener):
+    corrupt_path = tmp_path / f"session-{_session_id(3)}.json"
+    store = SessionStore(tmp_path, opener=memory_opener({corrupt_path: b"not-json"}))
     assert store.load(_session_id(3)) is None
 
 
@@ -68,29 +98,75 @@ def test_session_store_load_decode_error_returns_none(monkeypatch, tmp_path: Pat
     assert store.load(session.id) is None
 
 
-def test_session_store_list_sessions_filters_by_checklist(tmp_path: Path):
+def test_session_store_list_sessions_filters_by_checklist(
+    monkeypatch, tmp_path: Path, session_blob: bytes
+):
     store = SessionStore(tmp_path)
     (tmp_path / "session-corrupt.json").write_text("bad", encoding="utf-8")
-    store.save(_make_session(_session_id(4), "check-1", SessionStatus.IN_PROGRESS))
-    store.save(_make_session(_session_id(5), "check-2", SessionStatus.IN_PROGRESS))
+    for seed, checklist_id in ((4, "check-1"), (5, "check-2")):
+        _write_session_blob(
+            tmp_path, session_blob, _session_id(seed), checklist_id, SessionStatus.IN_PROGRESS
+        )
     results = store.list_sessions("check-1")
     assert len(results) == 1
     assert results[0].id == _session_id(4)
 
+    # The first listing built session-index.json; later listings filter through it.
+    assert (tmp_path / "session-index.json").is_file()
+    monkeypatch.setattr(store, "_scan_sessions", pytest.fail)
+    store.save(_make_session(_session_id(8), "check-1", SessionStatus.COMPLETED))
+    results = store.list_sessions("check-1")
+    assert sorted(summary.id for summary in results) == [_session_id(4), _session_id(8)]
+    assert [summary.id for summary in store.list_sessions("check-2")] == [_session_id(5)]
+
 
-def test_session_store_find_latest_in_progress(tmp_path: Path):
+def test_session_store_find_latest_in_progress(monkeypatch, tmp_path: Path):
+    # Index entries are ordered by save time; pin it instead of sleeping between saves.
+    clock = iter([1_000_000.0, 2_000_000.0])
+    monkeypatch.setattr(session_store_module, "time", SimpleNamespace(time=lambda: next(clock)))
     store = SessionStore(tmp_path)
     (tmp_path / "session-corrupt.json").write_text("bad", encoding="utf-8")
     session_old = _make_session(_session_id(6), "check-1", SessionStatus.IN_PROGRESS)
     session_new = _make_session(_session_id(7), "check-1", SessionStatus.IN_PROGRESS)
     store.save(session_old)
-    time.sleep(0.01)
     store.save(session_new)
     latest = store.find_latest_in_progress("check-1")
     assert latest is not None
     assert latest.id == _session_id(7)
 
 
+def test_session_store_find_latest_prefers_recent_journal(monkeypatch, tmp_path: Path):
+    clock = iter([1_000_000.0, 2_000_000.0])
+    monkeypatch.setattr(session_store_module, "time", SimpleNamespace(time=lambda: next(clock)))
+    store = SessionStore(tmp_path)
+    answered = _make_session(_session_id(17), "check-1", SessionStatus.IN_PROGRESS)
+    store.save(answered)
+    store.save(_make_session(_session_id(18), "check-1", SessionStatus.IN_PROGRESS))
+    answered.responses.append(Response(item_id="a", result=ItemResult.PASS, answered_at=_NOW))
+    journal = store.append_response(answered)
+    os.utime(journal, (3_000_000.0, 3_000_000.0))
+
+    latest = store.find_latest_in_progress("check-1")
+    assert latest is not None
+    assert latest.id == _session_id(17)
+    assert len(latest.responses) == 1
+
+
+def test_session_store_find_latest_in_progress_without_index(tmp_path: Path, session_blob: bytes):
+    store = SessionStore(tmp_path)
+    cases = (
+        (14, SessionStatus.IN_PROGRESS, 1_000_000.0),
+        (15, SessionStatus.IN_PROGRESS, 2_000_000.0),
+        (16, SessionStatus.COMPLETED, 3_000_000.0),
+    )
+    for seed, status, mtime in cases:
+        path = _write_session_blob(tmp_path, session_blob, _session_id(seed), "check-1", status)
+        os.utime(path, (mtime, mtime))
+    latest = store.find_latest_in_progress("check-1")
+    assert latest is not None
+    assert latest.id == _session_id(15)
+
+
 def test_session_store_find_latest_skips_completed(tmp_path: Path):
     store = SessionStore(tmp_path)
     store.save(_make_session(_session_id(11), "check-1", SessionStatus.COMPLETED))
@@ -119,3 +195,64 @@ def test_session_store_load_from_path(tmp_path: Path):
     path = store.save(session)
     loaded = store.load_from_path(path)
     assert loaded.id == session.id
+
+
+def test_session_store_replays_response_journal(tmp_path: Path):
+    store = SessionStore(tmp_path)
+    session = _make_session(_session_id(11), "check-1", SessionStatus.IN_PROGRESS)
+    path = store.save(session)
+    for item_id in ("a", "b"):
+        session.responses.append(
+            Response(item_id=item_id, result=ItemResult.PASS, answered_at=_NOW)
+        )
+        journal = store.append_response(session)
+    with journal.open("ab") as handle:
+        handle.write(b'[2,["c"')  # torn trailing write is ignored
+
+    loaded = store.load(session.id)
+    assert loaded is not None
+    assert [response.item_id for response in loaded.responses] == ["a", "b"]
+    assert store.load_from_path(path).responses == loaded.responses
+
+    store.save(loaded)
+    assert not journal.exists()
+    reloaded = store.load(session.id)
+    assert reloaded is not None
+    assert len(reloaded.responses) == 2
+
+
+def test_session_store_save_empties_journal_it_cannot_delete(monkeypatch, tmp_path: Path):
+    store = SessionStore(tmp_path)
+    session = _make_session(_session_id(12), "check-1", SessionStatus.IN_PROGRESS)
+    store.save(session)
+    for item_id in ("a", "b", "c"):
+        session.responses.append(
+            Response(item_id=item_id, result=ItemResult.PASS, answered_at=_NOW)
+        )
+        journal = store.append_response(session)
+
+    original_unlink = Path.unlink
+
+    def failing_unlink(self, missing_ok=False):
+        if self.suffix == ".ndjson":
+            raise PermissionError("journal is locked")
+        original_unlink(self, missing_ok=missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", failing_unlink)
+    store.save(session)
+    session.responses.pop()  # the user goes back one item
+    store.save(session)
+
+    assert journal.read_bytes() == b""
+    loaded = store.load(session.id)
+    assert loaded is not None
+    assert [response.item_id for response in loaded.responses] == ["a", "b"]
+
+
+def test_session_store_save_fails_when_journal_cannot_be_discarded(tmp_path: Path):
+    store = SessionStore(tmp_path)
+    session = _make_session(_session_id(13), "check-1", SessionStatus.IN_PROGRESS)
+    (tmp_path / f"session-{session.id}.ndjson").mkdir()  # neither removable nor truncatable
+
+    with pytest.raises(IsADirectoryError):
+        store.save(session)
@@ -5,12 +5,9 @@ from pathlib import Path
 import pytest
 
 from tick.adapters.loaders.yaml_loader import YamlChecklistLoader
+from tick.core.models.checklist import ChecklistDocument
 
-
-def test_yaml_loader_loads_minimal(tmp_path: Path):
-    path = tmp_path / "checklist.yaml"
-    path.write_text(
-        """
+_MINIMAL_YAML = b"""\
 checklist:
   name: "Minimal Checklist"
   version: "1.0.0"
@@ -20,25 +17,9 @@ checklist:
       items:
         - id: "item-1"
           check: "Do the thing"
-""".strip()
-    )
-    loader = YamlChecklistLoader()
-    checklist = loader.load(path)
-    assert checklist.name == "Minimal Checklist"
+"""
 
-
-def test_yaml_loader_rejects_non_mapping(tmp_path: Path):
-    path = tmp_path / "bad.yaml"
-    path.write_text("- item", encoding="utf-8")
-    loader = YamlChecklistLoader()
-    with pytest.raises(ValueError, match=r"mapping"):
-        loader.load(path)
-
-
-def test_yaml_loader_validate_schema_error(tmp_path: Path):
-    path = tmp_path / "invalid.yaml"
-    path.write_text(
-        """
+_MISSING_CHECK_YAML = b"""\
 checklist:
   name: "Bad Checklist"
   version: "1.0.0"
@@ -47,18 +28,9 @@ checklist:
     - name: "Basics"
       items:
         - id: "item-1"
-""".strip(),
-        encoding="utf-8",
-    )
-    loader = YamlChecklistLoader()
-    issues = loader.validate(path)
-    assert issues
-
+"""
 
-def test_yaml_loader_validate_pydantic_error(tmp_path: Path):
-    path = tmp_path / "invalid-severity.yaml"
-    path.write_text(
-        """
+_BAD_SEVERITY_YAML = b"""\
 checklist:
   name: "Bad Severity"
   version: "1.0.0"
@@ -69,29 +41,76 @@ checklist:
         - id: "item-1"
           check: "Do the thing"
           severity: "unknown"
-""".strip(),
-        encoding="utf-8",
-    )
-    loader = YamlChecklistLoader()
+"""
+
+
+def test_yaml_loader_loads_minimal(memory_opener):
+    path = Path("checklist.yaml")
+    loader = YamlChecklistLoader(opener=memory_opener({path: _MINIMAL_YAML}))
+    checklist = loader.load(path)
+    assert checklist.name == "Minimal Checklist"
+
+
+def test_yaml_loader_rejects_non_mapping(memory_opener):
+    path = Path("bad.yaml")
+    loader = YamlChecklistLoader(opener=memory_opener({path: b"- item"}))
+    with pytest.raises(ValueError, match=r"mapping"):
+        loader.load(path)
+
+
+def test_yaml_loader_validate_schema_error(memory_opener):
+    path = Path("invalid.yaml")
+    loader = YamlChecklistLoader(opener=memory_opener({path: _MISSING_CHECK_YAML}))
     issues = loader.validate(path)
     assert issues
 
 
-def test_yaml_loader_load_raises_on_validation_errors(tmp_path: Path):
-    path = tmp_path / "invalid-load.yaml"
-    path.write_text(
-        """
-checklist:
-  name: "Bad Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-""".strip(),
-        encoding="utf-8",
-    )
-    loader = YamlChecklistLoader()
+def test_yaml_loader_validate_pydantic_error(memory_opener):
+    path = Path("invalid-severity.yaml")
+    loader = YamlChecklistLoader(opener=memory_opener({path: _BAD_SEVERITY_YAML}))
+    issues = loader.validate(path)
+    assert issues
+
+
+def test_yaml_loader_load_raises_on_validation_errors(memory_opener):
+    path = Path("invalid-load.yaml")
+    loader = YamlChecklistLoader(opener=memory_opener({path: _MISSING_CHECK_YAML}))
     with pytest.raises(ValueError, match=r"validation failed"):
         loader.load(path)
+
+
+def test_yaml_loader_missing_file_raises(memory_opener):
+    loader = YamlChecklistLoader(opener=memory_opener({}))
+    with pytest.raises(FileNotFoundError):
+        loader.load(Path("missing.yaml"))
+
+
+def test_yaml_loader_returns_independent_models_for_identical_bytes(memory_opener):
+    first = Path("first.yaml")
+    second = Path("second.yaml")
+    opener = memory_opener({first: _MINIMAL_YAML, second: _MINIMAL_YAML})
+    loaded = YamlChecklistLoader(opener=opener).load(first)
+    loaded.sections.clear()
+
+    other = YamlChecklistLoader(opener=opener).load(second)
+    assert other is not loaded
+    assert len(other.sections) == 1
+    assert other == YamlChecklistLoader(opener=opener).load(first)
+
+
+def test_yaml_loader_without_memoize_builds_one_document_per_load(monkeypatch, memory_opener):
+    path = Path("checklist.yaml")
+    loader = YamlChecklistLoader(opener=memory_opener({path: _MINIMAL_YAML}), memoize=False)
+    calls = []
+    original_from_raw = ChecklistDocument.from_raw
+
+    def counting_from_raw(raw):
+        calls.append(raw)
+        return original_from_raw(raw)
+
+    monkeypatch.setattr(ChecklistDocument, "from_raw", counting_from_raw)
+    first = loader.load(path)
+    second = loader.load(path)
+    assert first == second
+    assert first is not second
+    assert len(calls) == 2
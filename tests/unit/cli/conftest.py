@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+
+import pytest
+import typer
+
+
+@pytest.fixture(scope="session")
+def worker_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("tick-cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(monkeypatch: pytest.MonkeyPatch, worker_cache_dir: Path) -> None:
+    """Keep CLI tests off the user cache and out of each other's way under xdist."""
+    monkeypatch.setenv("TICK_CACHE_DIR", str(worker_cache_dir))
+
+
+@pytest.fixture(scope="session")
+def shared_cli_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("run_cli")
+
+
+@pytest.fixture
+def cli_paths(shared_cli_dir: Path, request: pytest.FixtureRequest) -> Path:
+    """Per-test writable directory carved out of one session-scoped temp dir.
+
+    Named after the full node id so equal test names in different files never collide.
+    """
+    path = shared_cli_dir / re.sub(r"[^\w.-]+", "_", request.node.nodeid)
+    path.mkdir()
+    return path
+
+
+def _write(path: Path, data: str | bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data if isinstance(data, bytes) else data.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _read(path: Path) -> bytes:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def write_file() -> Callable[[Path, str | bytes], None]:
+    """Write text or bytes with a single os-level call, skipping pathlib overhead."""
+    return _write
+
+
+@pytest.fixture(scope="session")
+def read_file() -> Callable[[Path], bytes]:
+    """Read a whole file with a single os-level call."""
+    return _read
+
+
+@contextmanager
+def _expect_exit(code: int = 1) -> Iterator[None]:
+    try:
+        yield
+    except typer.Exit as exc:
+        exit_code = exc.exit_code
+    else:
+        raise AssertionError(f"expected typer.Exit({code})")
+    assert exit_code == code
+
+
+@pytest.fixture
+def expect_exit() -> Callable[..., AbstractContextManager[None]]:
+    """Assert that the block raises ``typer.Exit`` with the given code (default 1)."""
+    return _expect_exit
@@ -11,14 +11,9 @@ from tick.cli.app import app
 from tick.core.models.enums import ItemResult, SessionStatus
 from tick.core.models.session import Response, Session
 
+_NOW = datetime(2025, 1, 1, tzinfo=UTC)
 
-def _session_id(seed: int) -> str:
-    return f"{seed:032x}"
-
-
-def _write_minimal_checklist(path: Path) -> None:
-    path.write_text(
-        """
+_MINIMAL_YAML = b"""\
 checklist:
   name: "Minimal Checklist"
   version: "1.0.0"
@@ -28,14 +23,9 @@ checklist:
       items:
         - id: "item-1"
           check: "Do the thing"
-""".strip(),
-        encoding="utf-8",
-    )
+"""
 
-
-def _write_matrix_checklist(path: Path) -> None:
-    path.write_text(
-        """
+_MATRIX_YAML = b"""\
 checklist:
   name: "Matrix Checklist"
   version: "1.0.0"
@@ -48,9 +38,44 @@ checklist:
           matrix:
             - role: "user"
             - role: "admin"
-""".strip(),
-        encoding="utf-8",
-    )
+"""
+
+_MATRIX_ANSWERS_YAML = b"""\
+variables:
+  environment: "dev"
+responses:
+  - item_id: "item-1"
+    matrix:
+      role: "user"
+    result: "pass"
+    notes: "ok"
+    evidence: "log.txt"
+  - item_id: "item-1"
+    matrix:
+      role: "admin"
+    result: "fail"
+    notes: "needs work"
+    evidence:
+      - "screenshot.png"
+"""
+
+_PASS_ANSWERS_YAML = b"""\
+responses:
+  item-1:
+    result: pass
+"""
+
+
+def _session_id(seed: int) -> str:
+    return f"{seed:032x}"
+
+
+def _write_minimal_checklist(path: Path) -> None:
+    path.write_bytes(_MINIMAL_YAML)
+
+
+def _write_matrix_checklist(path: Path) -> None:
+    path.write_bytes(_MATRIX_YAML)
 
 
 def test_validate_command_success(tmp_path: Path):
@@ -141,13 +166,13 @@ def test_report_command_generates_output(tmp_path: Path):
         id=_session_id(1),
         checklist_id="minimal-checklist-1.0.0",
         checklist_path=str(checklist_path),
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=[
             Response(
                 item_id="item-1",
                 result=ItemResult.PASS,
-                answered_at=datetime.now(UTC),
+                answered_at=_NOW,
             )
         ],
         variables={},
@@ -181,7 +206,7 @@ def test_report_command_missing_checklist(tmp_path: Path):
         id=_session_id(2),
         checklist_id="minimal-checklist-1.0.0",
         checklist_path=None,
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=[],
         variables={},
@@ -200,7 +225,7 @@ def test_report_command_uses_session_checklist_path(tmp_path: Path):
         id=_session_id(4),
         checklist_id="minimal-checklist-1.0.0",
         checklist_path=str(checklist_path),
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=[],
         variables={},
@@ -228,7 +253,7 @@ def test_report_command_digest_mismatch(tmp_path: Path):
         id=_session_id(5),
         checklist_id="minimal-checklist-1.0.0",
         checklist_path=str(checklist_path),
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=[],
         variables={},
@@ -258,7 +283,7 @@ def test_report_command_unsupported_format(tmp_path: Path):
         id=_session_id(3),
         checklist_id="minimal-checklist-1.0.0",
         checklist_path=str(checklist_path),
-        started_at=datetime.now(UTC),
+        started_at=_NOW,
         status=SessionStatus.COMPLETED,
         responses=[],
         variables={},
@@ -284,27 +309,7 @@ def test_run_command_non_interactive(tmp_path: Path):
     checklist_path = tmp_path / "checklist.yaml"
     _write_matrix_checklist(checklist_path)
     answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text(
-        """
-variables:
-  environment: "dev"
-responses:
-  - item_id: "item-1"
-    matrix:
-      role: "user"
-    result: "pass"
-    notes: "ok"
-    evidence: "log.txt"
-  - item_id: "item-1"
-    matrix:
-      role: "admin"
-    result: "fail"
-    notes: "needs work"
-    evidence:
-      - "screenshot.png"
-""".strip(),
-        encoding="utf-8",
-    )
+    answers_path.write_bytes(_MATRIX_ANSWERS_YAML)
     output_dir = tmp_path / "reports"
     runner = CliRunner()
     result = runner.invoke(
@@ -347,14 +352,7 @@ def test_run_command_verbose_flag(tmp_path: Path):
     _write_minimal_checklist(checklist_path)
     output_dir = tmp_path / "reports"
     answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text(
-        """
-responses:
-  item-1:
-    result: pass
-""".strip(),
-        encoding="utf-8",
-    )
+    answers_path.write_bytes(_PASS_ANSWERS_YAML)
     runner = CliRunner()
     result = runner.invoke(
         app,
@@ -30,6 +30,7 @@ def test_init_command_template_read_failure(monkeypatch, tmp_path: Path) -> None
         raise OSError("boom")
 
     monkeypatch.setattr(init_module.resources, "files", fail_files)
+    init_module._load_template.cache_clear()
     with pytest.raises(typer.Exit) as excinfo:
         init_command(template="web", output=tmp_path / "out.yaml", overwrite=False)
     assert excinfo.value.exit_code == 1
@@ -1,28 +1,22 @@
 from __future__ import annotations
 
-import os
+from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 
 import pytest
-import typer
 
+from tick.adapters.loaders.yaml_loader import safe_yaml
+from tick.cli.commands import run as run_module
 from tick.cli.commands.run import run_command
 from tick.core.models.checklist import ChecklistDocument, compute_checklist_digest
-from tick.core.models.enums import ItemResult, SessionStatus
-from tick.core.models.session import Response, Session, decode_session, encode_session
+from tick.core.models.enums import ItemResult
+from tick.core.models.session import Response, decode_session
 
+_EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
 
-def _session_file(output_dir: Path) -> Path:
-    return next(
-        path for path in output_dir.glob("session-*.json") if path.name != "session-index.json"
-    )
-
-
-def test_run_command_requires_variables(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
+_VARIABLES_YAML = """
 checklist:
   name: "Minimal Checklist"
   version: "1.0.0"
@@ -38,9 +32,34 @@ checklist:
         - id: "item-1"
           check: "Do the thing"
 """.strip()
-    )
-    output_dir = tmp_path / "reports"
-    with pytest.raises(typer.Exit) as excinfo:
+
+_MATRIX_YAML = """
+checklist:
+  name: "Matrix Checklist"
+  version: "1.0.0"
+  domain: "web"
+  sections:
+    - name: "Matrix"
+      items:
+        - id: "item-1"
+          check: "Matrix check"
+          matrix:
+            - role: "user"
+            - role: "admin"
+""".strip()
+
+
+@cache
+def _digest_for(yaml_bytes: bytes) -> str:
+    document = ChecklistDocument.from_raw(safe_yaml().load(yaml_bytes))
+    return compute_checklist_digest(document.checklist)
+
+
+def test_run_command_requires_variables(cli_paths: Path, expect_exit, write_file) -> None:
+    checklist_path = cli_paths / "checklist.yaml"
+    write_file(checklist_path, _VARIABLES_YAML)
+    output_dir = cli_paths / "reports"
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -48,76 +67,95 @@ checklist:
             answers=None,
             resume=False,
         )
-    assert excinfo.value.exit_code == 1
 
 
-def test_run_command_parses_evidence(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text(
-        """
-responses:
-  item-1:
-    result: pass
-    evidence: "link-1, link-2"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
-    run_command(
-        checklist=checklist_path,
-        output_dir=output_dir,
+@pytest.mark.parametrize(
+    ("answers_text", "expected_result", "expected_notes", "expected_evidence", "warning"),
+    [
+        pytest.param(
+            'responses:\n  item-1:\n    result: pass\n    evidence: "link-1, link-2"\n',
+            ItemResult.PASS,
+            None,
+            ("link-1", "link-2"),
+            None,
+            id="parses-evidence",
+        ),
+        pytest.param(
+            "responses:\n  item-1:\n    result: pass\n  extra-1:\n    result: fail\n",
+            ItemResult.PASS,
+            None,
+            (),
+            "1 answer entries did not match any checklist item",
+            id="warns-on-unused-answers",
+        ),
+        pytest.param(
+            'responses:\n  item-1:\n    result: fail\n    notes: "failed"\n',
+            ItemResult.FAIL,
+            "failed",
+            (),
+            None,
+            id="uses-answer",
+        ),
+        pytest.param(None, ItemResult.SKIP, None, (), None, id="skips-missing-answers"),
+    ],
+)
+def test_run_command_non_interactive_variants(
+    capsys,
+    cli_paths: Path,
+    minimal_checklist_path: Path,
+    answers_text: str | None,
+    expected_result: ItemResult,
+    expected_notes: str | None,
+    expected_evidence: tuple[str, ...],
+    warning: str | None,
+    write_file,
+    read_file,
+) -> None:
+    answers_path = None
+    if answers_text is not None:
+        answers_path = cli_paths / "answers.yaml"
+        write_file(answers_path, answers_text)
+    session_path = run_command(
+        checklist=minimal_checklist_path,
+        output_dir=cli_paths / "reports",
         no_interactive=True,
         answers=answers_path,
         resume=False,
     )
-    session_path = _session_file(output_dir)
-    session = decode_session(session_path.read_bytes())
-    assert session.responses[0].evidence == ("link-1", "link-2")
-
-
-def test_run_command_resume_digest_mismatch(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
+    session = decode_session(read_file(session_path))
+    assert len(session.responses) == 1
+    response = session.responses[0]
+    assert response.result == expected_result
+    assert response.notes == expected_notes
+    assert response.evidence == expected_evidence
+    output = capsys.readouterr().out
+    if warning:
+        assert warning in output
+    else:
+        assert "did not match" not in output
+
+
+def test_run_command_resume_digest_mismatch(
+    cli_paths: Path,
+    minimal_checklist_path: Path,
+    make_session_bytes: Callable[..., bytes],
+    expect_exit,
+    write_file,
+) -> None:
+    checklist_path = minimal_checklist_path
+    output_dir = cli_paths / "reports"
     output_dir.mkdir()
-    session = Session(
-        id="c" * 32,
-        checklist_id="minimal-checklist-1.0.0",
-        checklist_path=str(checklist_path),
-        checklist_digest="deadbeef",
-        started_at=datetime.now(UTC),
-        status=SessionStatus.IN_PROGRESS,
-        variables={},
-        responses=[],
-    )
+    session_id = "c" * 32
     session_path = output_dir / "session-c.json"
-    session_path.write_bytes(encode_session(session))
-    with pytest.raises(typer.Exit) as excinfo:
+    write_file(
+        session_path,
+        make_session_bytes(
+            id=session_id,
+            checklist_path=str(checklist_path),
+            checklist_digest="deadbeef",
+        ),
+    )
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -125,28 +163,19 @@ checklist:
             answers=None,
             resume=True,
         )
-    assert excinfo.value.exit_code == 1
 
 
-def test_run_command_invalid_answers_yaml(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text("responses: [", encoding="utf-8")
-    output_dir = tmp_path / "reports"
-    with pytest.raises(typer.Exit) as excinfo:
+def test_run_command_invalid_answers_yaml(
+    cli_paths: Path,
+    minimal_checklist_path: Path,
+    expect_exit,
+    write_file,
+) -> None:
+    checklist_path = minimal_checklist_path
+    answers_path = cli_paths / "answers.yaml"
+    write_file(answers_path, "responses: [")
+    output_dir = cli_paths / "reports"
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -154,27 +183,15 @@ checklist:
             answers=answers_path,
             resume=False,
         )
-    assert excinfo.value.exit_code == 1
 
 
-def test_run_command_missing_answers_file(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
-    missing_answers = tmp_path / "missing.yaml"
-    with pytest.raises(typer.Exit) as excinfo:
+def test_run_command_missing_answers_file(
+    cli_paths: Path, minimal_checklist_path: Path, expect_exit
+) -> None:
+    checklist_path = minimal_checklist_path
+    output_dir = cli_paths / "reports"
+    missing_answers = cli_paths / "missing.yaml"
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -182,14 +199,13 @@ checklist:
             answers=missing_answers,
             resume=False,
         )
-    assert excinfo.value.exit_code == 1
 
 
-def test_run_command_invalid_checklist(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text("name: bad", encoding="utf-8")
-    output_dir = tmp_path / "reports"
-    with pytest.raises(typer.Exit) as excinfo:
+def test_run_command_invalid_checklist(cli_paths: Path, expect_exit, write_file) -> None:
+    checklist_path = cli_paths / "checklist.yaml"
+    write_file(checklist_path, "name: bad")
+    output_dir = cli_paths / "reports"
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -197,32 +213,15 @@ def test_run_command_invalid_checklist(tmp_path: Path) -> None:
             answers=None,
             resume=False,
         )
-    assert excinfo.value.exit_code == 1
 
 
-def test_run_command_invalid_variables_mapping(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  variables:
-    env:
-      prompt: "Environment"
-      required: true
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text("variables: [1, 2]", encoding="utf-8")
-    output_dir = tmp_path / "reports"
-    with pytest.raises(typer.Exit) as excinfo:
+def test_run_command_invalid_variables_mapping(cli_paths: Path, expect_exit, write_file) -> None:
+    checklist_path = cli_paths / "checklist.yaml"
+    write_file(checklist_path, _VARIABLES_YAML)
+    answers_path = cli_paths / "answers.yaml"
+    write_file(answers_path, "variables: [1, 2]")
+    output_dir = cli_paths / "reports"
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -230,59 +229,16 @@ checklist:
             answers=answers_path,
             resume=False,
         )
-    assert excinfo.value.exit_code == 1
 
 
-def test_run_command_output_dir_not_writable(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
+def test_run_command_output_dir_not_writable(
+    monkeypatch, cli_paths: Path, minimal_checklist_path: Path, expect_exit
+) -> None:
+    checklist_path = minimal_checklist_path
+    output_dir = cli_paths / "reports"
     output_dir.mkdir()
-    os.chmod(output_dir, 0o500)
-    try:
-        with pytest.raises(typer.Exit) as excinfo:
-            run_command(
-                checklist=checklist_path,
-                output_dir=output_dir,
-                no_interactive=True,
-                answers=None,
-                resume=False,
-            )
-        assert excinfo.value.exit_code == 1
-    finally:
-        os.chmod(output_dir, 0o700)
-
-
-def test_run_command_output_dir_is_file(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
-    output_dir.write_text("not-a-dir", encoding="utf-8")
-    with pytest.raises(typer.Exit) as excinfo:
+    monkeypatch.setattr(run_module, "_is_writable", lambda path: False)
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -290,80 +246,52 @@ checklist:
             answers=None,
             resume=False,
         )
-    assert excinfo.value.exit_code == 1
 
 
-def test_run_command_warns_on_unused_answers(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text(
-        """
-responses:
-  item-1:
-    result: pass
-  extra-1:
-    result: fail
-""".strip(),
-        encoding="utf-8",
-    )
-    output_dir = tmp_path / "reports"
-    run_command(
-        checklist=checklist_path,
-        output_dir=output_dir,
-        no_interactive=True,
-        answers=answers_path,
-        resume=False,
-    )
-    assert list(output_dir.glob("session-*.json"))
+def test_run_command_output_dir_is_file(
+    cli_paths: Path,
+    minimal_checklist_path: Path,
+    expect_exit,
+    write_file,
+) -> None:
+    checklist_path = minimal_checklist_path
+    output_dir = cli_paths / "reports"
+    write_file(output_dir, "not-a-dir")
+    with expect_exit():
+        run_command(
+            checklist=checklist_path,
+            output_dir=output_dir,
+            no_interactive=True,
+            answers=None,
+            resume=False,
+        )
 
 
-def test_run_command_resume_sets_digest(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
+def test_run_command_resume_sets_digest(
+    cli_paths: Path,
+    minimal_checklist_path: Path,
+    make_session_bytes: Callable[..., bytes],
+    write_file,
+    read_file,
+) -> None:
+    checklist_path = minimal_checklist_path
+    output_dir = cli_paths / "reports"
     output_dir.mkdir()
     response = Response(
         item_id="item-1",
         result=ItemResult.PASS,
-        answered_at=datetime.now(UTC),
-    )
-    session = Session(
-        id="d" * 32,
-        checklist_id="minimal-checklist-1.0.0",
-        checklist_path=str(checklist_path),
-        checklist_digest=None,
-        started_at=datetime.now(UTC),
-        status=SessionStatus.IN_PROGRESS,
-        variables={},
-        responses=[response],
+        answered_at=_EPOCH,
+    )
+    session_id = "d" * 32
+    session_path = output_dir / f"session-{session_id}.json"
+    write_file(
+        session_path,
+        make_session_bytes(
+            id=session_id,
+            checklist_path=str(checklist_path),
+            responses=[response],
+        ),
     )
-    session_path = output_dir / f"session-{session.id}.json"
-    session_path.write_bytes(encode_session(session))
 
     run_command(
         checklist=checklist_path,
@@ -372,57 +300,37 @@ checklist:
         answers=None,
         resume=True,
     )
-    updated = decode_session(session_path.read_bytes())
+    updated = decode_session(read_file(session_path))
     assert updated.checklist_digest is not None
 
 
-def test_run_command_resume_with_existing_digest(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
+def test_run_command_resume_with_existing_digest(
+    cli_paths: Path,
+    minimal_checklist_path: Path,
+    make_session_bytes: Callable[..., bytes],
+    write_file,
+    read_file,
+) -> None:
+    checklist_path = minimal_checklist_path
+    output_dir = cli_paths / "reports"
     output_dir.mkdir()
     response = Response(
         item_id="item-1",
         result=ItemResult.PASS,
-        answered_at=datetime.now(UTC),
-    )
-    session = Session(
-        id="f" * 32,
-        checklist_id="minimal-checklist-1.0.0",
-        checklist_path=str(checklist_path),
-        checklist_digest=compute_checklist_digest(
-            ChecklistDocument.from_raw(
-                {
-                    "checklist": {
-                        "name": "Minimal Checklist",
-                        "version": "1.0.0",
-                        "domain": "web",
-                        "sections": [
-                            {"name": "Basics", "items": [{"id": "item-1", "check": "Do the thing"}]}
-                        ],
-                    }
-                }
-            ).checklist
+        answered_at=_EPOCH,
+    )
+    session_id = "f" * 32
+    session_path = output_dir / f"session-{session_id}.json"
+    digest = _digest_for(read_file(checklist_path))
+    write_file(
+        session_path,
+        make_session_bytes(
+            id=session_id,
+            checklist_path=str(checklist_path),
+            checklist_digest=digest,
+            responses=[response],
         ),
-        started_at=datetime.now(UTC),
-        status=SessionStatus.IN_PROGRESS,
-        variables={},
-        responses=[response],
     )
-    session_path = output_dir / f"session-{session.id}.json"
-    session_path.write_bytes(encode_session(session))
 
     run_command(
         checklist=checklist_path,
@@ -431,46 +339,37 @@ checklist:
         answers=None,
         resume=True,
     )
-    updated = decode_session(session_path.read_bytes())
-    assert updated.checklist_digest == session.checklist_digest
+    updated = decode_session(read_file(session_path))
+    assert updated.checklist_digest == digest
 
 
-def test_run_command_resume_rejects_mismatched_session(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
+def test_run_command_resume_rejects_mismatched_session(
+    cli_paths: Path,
+    minimal_checklist_path: Path,
+    make_session_bytes: Callable[..., bytes],
+    expect_exit,
+    write_file,
+) -> None:
+    checklist_path = minimal_checklist_path
+    output_dir = cli_paths / "reports"
     output_dir.mkdir()
     response = Response(
         item_id="wrong",
         result=ItemResult.PASS,
-        answered_at=datetime.now(UTC),
-    )
-    session = Session(
-        id="e" * 32,
-        checklist_id="minimal-checklist-1.0.0",
-        checklist_path=str(checklist_path),
-        checklist_digest=None,
-        started_at=datetime.now(UTC),
-        status=SessionStatus.IN_PROGRESS,
-        variables={},
-        responses=[response],
+        answered_at=_EPOCH,
+    )
+    session_id = "e" * 32
+    session_path = output_dir / f"session-{session_id}.json"
+    write_file(
+        session_path,
+        make_session_bytes(
+            id=session_id,
+            checklist_path=str(checklist_path),
+            responses=[response],
+        ),
     )
-    session_path = output_dir / f"session-{session.id}.json"
-    session_path.write_bytes(encode_session(session))
 
-    with pytest.raises(typer.Exit) as excinfo:
+    with expect_exit():
         run_command(
             checklist=checklist_path,
             output_dir=output_dir,
@@ -478,82 +377,33 @@ checklist:
             answers=None,
             resume=True,
         )
-    assert excinfo.value.exit_code == 1
-
-
-def test_run_command_non_interactive_uses_answer(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Minimal Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "Do the thing"
-""".strip()
-    )
-    answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text(
-        """
-responses:
-  item-1:
-    result: fail
-    notes: "failed"
-""".strip()
-    )
-    output_dir = tmp_path / "reports"
-    run_command(
-        checklist=checklist_path,
-        output_dir=output_dir,
-        no_interactive=True,
-        answers=answers_path,
-        resume=False,
-    )
-    session_path = _session_file(output_dir)
-    session = decode_session(session_path.read_bytes())
-    assert session.responses[0].result == ItemResult.FAIL
 
 
-def test_run_command_non_interactive_matrix_no_match(tmp_path: Path) -> None:
-    checklist_path = tmp_path / "checklist.yaml"
-    checklist_path.write_text(
-        """
-checklist:
-  name: "Matrix Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Matrix"
-      items:
-        - id: "item-1"
-          check: "Matrix check"
-          matrix:
-            - role: "user"
-            - role: "admin"
-""".strip()
-    )
-    answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text(
+def test_run_command_non_interactive_matrix_no_match(
+    cli_paths: Path,
+    write_file,
+    read_file,
+) -> None:
+    checklist_path = cli_paths / "checklist.yaml"
+    write_file(checklist_path, _MATRIX_YAML)
+    answers_path = cli_paths / "answers.yaml"
+    write_file(
+        answers_path,
         """
 responses:
   - item_id: "item-1"
     matrix:
       role: "guest"
     result: pass
-""".strip()
+""".strip(),
     )
-    output_dir = tmp_path / "reports"
-    run_command(
+    output_dir = cli_paths / "reports"
+    session_path = run_command(
         checklist=checklist_path,
         output_dir=output_dir,
         no_interactive=True,
         answers=answers_path,
         resume=False,
     )
-    session_path = _session_file(output_dir)
-    session = decode_session(session_path.read_bytes())
+    session = decode_session(read_file(session_path))
     assert len(session.responses) == 2
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import os
+import shutil
+from collections.abc import Callable
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 import typer
@@ -18,56 +22,89 @@ from tick.core.models.enums import ItemResult
 from tick.core.state import ResolvedItem
 from tick.core.utils import matrix_key, normalize_evidence
 
-
-def _write_minimal_checklist(path: Path) -> None:
-    path.write_text(
-        """
+_VARIABLES_YAML = b"""\
 checklist:
-  name: "Minimal Checklist"
+  name: "Variables Checklist"
   version: "1.0.0"
   domain: "web"
+  variables:
+    environment:
+      prompt: "Environment"
+      required: true
+      options: ["dev", "prod"]
   sections:
     - name: "Basics"
       items:
         - id: "item-1"
           check: "Do the thing"
-""".strip(),
-        encoding="utf-8",
-    )
+"""
 
-
-def _write_variable_checklist(path: Path) -> None:
-    path.write_text(
-        """
+_MULTI_ITEM_YAML = b"""\
 checklist:
-  name: "Variables Checklist"
+  name: "Multi Item Checklist"
   version: "1.0.0"
   domain: "web"
-  variables:
-    environment:
-      prompt: "Environment"
-      required: true
-      options: ["dev", "prod"]
   sections:
     - name: "Basics"
       items:
         - id: "item-1"
-          check: "Do the thing"
-""".strip(),
-        encoding="utf-8",
-    )
+          check: "First item"
+        - id: "item-2"
+          check: "Second item"
+        - id: "item-3"
+          check: "Third item"
+"""
+
+
+@pytest.fixture(scope="session")
+def variable_checklist_path(tmp_path_factory: pytest.TempPathFactory, write_file) -> Path:
+    path = tmp_path_factory.mktemp("checklists") / "variables.yaml"
+    write_file(path, _VARIABLES_YAML)
+    return path
+
 
+@pytest.fixture(scope="session")
+def multi_item_checklist_path(tmp_path_factory: pytest.TempPathFactory, write_file) -> Path:
+    path = tmp_path_factory.mktemp("checklists") / "multi-item.yaml"
+    write_file(path, _MULTI_ITEM_YAML)
+    return path
 
-def test_load_answers_returns_empty_for_non_mapping(tmp_path: Path):
+
+def _stage(source: Path, directory: Path) -> Path:
+    """Expose a shared checklist file inside a test directory without rewriting it."""
+    target = directory / "checklist.yaml"
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+    return target
+
+
+@pytest.fixture
+def stub_prompts(monkeypatch) -> SimpleNamespace:
+    """Stub interactive prompts: no variables and a passing answer for every item."""
+
+    def set_variables(values: dict[str, object]) -> None:
+        monkeypatch.setattr(run_module, "ask_variables", lambda variables, console: values)
+
+    def set_response(fake: Callable[..., object]) -> None:
+        monkeypatch.setattr(run_module, "ask_item_response", fake)
+
+    set_variables({})
+    set_response(lambda *args, **kwargs: (ItemResult.PASS, None, []))
+    return SimpleNamespace(set_variables=set_variables, set_response=set_response)
+
+
+def test_load_answers_returns_empty_for_non_mapping(tmp_path: Path, write_file):
     path = tmp_path / "answers.yaml"
-    path.write_text("- item", encoding="utf-8")
+    write_file(path, "- item")
     with pytest.raises(ValueError, match=r"mapping"):
         _load_answers(path)
 
 
-def test_load_answers_empty_file_returns_empty(tmp_path: Path):
+def test_load_answers_empty_file_returns_empty(tmp_path: Path, write_file):
     path = tmp_path / "answers.yaml"
-    path.write_text("", encoding="utf-8")
+    write_file(path, "")
     assert _load_answers(path) == {}
 
 
@@ -92,6 +129,17 @@ def test_normalize_responses_accepts_dict_and_list():
     assert _normalize_responses(data_missing_id) == {}
 
 
+def test_normalize_responses_keeps_keys_that_collide_as_strings():
+    data = {"responses": {1: {"result": "pass"}, "1": {"result": "fail"}}}
+    normalized = _normalize_responses(data)
+    assert normalized == {
+        "1": [
+            {"result": "pass", "item_id": 1},
+            {"result": "fail", "item_id": "1"},
+        ]
+    }
+
+
 def test_parse_result_defaults():
     assert _parse_result(None) == ItemResult.SKIP
     assert _parse_result("unknown") == ItemResult.SKIP
@@ -100,6 +148,8 @@ def test_parse_result_defaults():
     assert _parse_result("s") == ItemResult.SKIP
     assert _parse_result("n") == ItemResult.NOT_APPLICABLE
     assert _parse_result("na") == ItemResult.NOT_APPLICABLE
+    assert _parse_result(" Not-Applicable ") == ItemResult.NOT_APPLICABLE
+    assert _parse_result("f") == ItemResult.FAIL
 
 
 def test_matrix_key_normalization():
@@ -148,40 +198,38 @@ def test_resolve_variables_skips_none_optional():
     assert "optional" not in resolved
 
 
-def test_run_command_interactive(monkeypatch, tmp_path: Path):
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_minimal_checklist(checklist_path)
+def test_run_command_interactive(stub_prompts, tmp_path: Path, minimal_checklist_path: Path):
+    checklist_path = _stage(minimal_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
 
-    monkeypatch.setattr(run_module, "ask_variables", lambda variables, console: {"env": "dev"})
+    stub_prompts.set_variables({"env": "dev"})
 
     def fake_item_response(*args, **kwargs):
         return ItemResult.PASS, "ok", ["log.txt"]
 
-    monkeypatch.setattr(run_module, "ask_item_response", fake_item_response)
-    run_command(
+    stub_prompts.set_response(fake_item_response)
+    session_path = run_command(
         checklist=checklist_path,
         output_dir=output_dir,
         no_interactive=False,
         answers=None,
         resume=False,
     )
-    assert list(output_dir.glob("session-*.json"))
+    assert session_path.is_file()
 
 
-def test_run_command_resume_with_answers(tmp_path: Path):
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_minimal_checklist(checklist_path)
+def test_run_command_resume_with_answers(tmp_path: Path, minimal_checklist_path: Path, write_file):
+    checklist_path = _stage(minimal_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
     answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text(
+    write_file(
+        answers_path,
         """
 responses:
   item-1:
     result: "pass"
     evidence: "log.txt"
 """.strip(),
-        encoding="utf-8",
     )
 
     with pytest.raises(typer.Exit) as excinfo:
@@ -195,12 +243,13 @@ responses:
     assert excinfo.value.exit_code == 1
 
 
-def test_run_command_no_interactive_missing_variables(tmp_path: Path):
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_variable_checklist(checklist_path)
+def test_run_command_no_interactive_missing_variables(
+    tmp_path: Path, variable_checklist_path: Path, write_file
+):
+    checklist_path = _stage(variable_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
     answers_path = tmp_path / "answers.yaml"
-    answers_path.write_text("variables: {}", encoding="utf-8")
+    write_file(answers_path, "variables: {}")
     with pytest.raises(typer.Exit) as excinfo:
         run_command(
             checklist=checklist_path,
@@ -212,9 +261,8 @@ def test_run_command_no_interactive_missing_variables(tmp_path: Path):
     assert excinfo.value.exit_code == 1
 
 
-def test_run_command_resume_digest_mismatch(tmp_path: Path):
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_minimal_checklist(checklist_path)
+def test_run_command_resume_digest_mismatch(tmp_path: Path, minimal_checklist_path: Path):
+    checklist_path = _stage(minimal_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
     with pytest.raises(typer.Exit) as excinfo:
         run_command(
@@ -227,24 +275,10 @@ def test_run_command_resume_digest_mismatch(tmp_path: Path):
     assert excinfo.value.exit_code == 1
 
 
-def test_run_command_no_interactive_skips_missing_answers(tmp_path: Path):
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_minimal_checklist(checklist_path)
-    output_dir = tmp_path / "reports"
-    run_command(
-        checklist=checklist_path,
-        output_dir=output_dir,
-        no_interactive=True,
-        answers=None,
-        resume=False,
-    )
-    session_files = list(output_dir.glob("session-*.json"))
-    assert session_files
-
-
-def test_run_command_breaks_on_none_current_item(monkeypatch, tmp_path: Path):
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_minimal_checklist(checklist_path)
+def test_run_command_breaks_on_none_current_item(
+    monkeypatch, stub_prompts, tmp_path: Path, minimal_checklist_path: Path
+):
+    checklist_path = _stage(minimal_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
 
     sequence = [ResolvedItem(section_name="Basics", item=None), None]
@@ -252,73 +286,58 @@ def test_run_command_breaks_on_none_current_item(monkeypatch, tmp_path: Path):
     def fake_current_item(self):
         return sequence.pop(0)
 
-    monkeypatch.setattr(run_module, "ask_variables", lambda variables, console: {})
-    monkeypatch.setattr(
-        run_module, "ask_item_response", lambda *args, **kwargs: (ItemResult.PASS, None, [])
-    )
     monkeypatch.setattr(run_module.ExecutionEngine, "current_item", property(fake_current_item))
 
-    run_command(
+    session_path = run_command(
         checklist=checklist_path,
         output_dir=output_dir,
         no_interactive=False,
         answers=None,
         resume=False,
     )
-    assert list(output_dir.glob("session-*.json"))
+    assert session_path.is_file()
 
 
-def _write_multi_item_checklist(path: Path) -> None:
-    path.write_text(
-        """
-checklist:
-  name: "Multi Item Checklist"
-  version: "1.0.0"
-  domain: "web"
-  sections:
-    - name: "Basics"
-      items:
-        - id: "item-1"
-          check: "First item"
-        - id: "item-2"
-          check: "Second item"
-        - id: "item-3"
-          check: "Third item"
-""".strip(),
-        encoding="utf-8",
-    )
-
-
-def test_run_command_autosave_after_each_response(monkeypatch, tmp_path: Path):
+def test_run_command_autosave_after_each_response(
+    monkeypatch,
+    stub_prompts,
+    tmp_path: Path,
+    multi_item_checklist_path: Path,
+    read_file,
+):
     """Verify that sessions are auto-saved after each response in interactive mode."""
     from tick.core.models.session import decode_session
 
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_multi_item_checklist(checklist_path)
+    checklist_path = _stage(multi_item_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
 
     response_count = 0
-    saved_response_counts: list[int] = []
-
-    monkeypatch.setattr(run_module, "ask_variables", lambda variables, console: {})
 
     def fake_item_response(*args, **kwargs):
         nonlocal response_count
         response_count += 1
         return ItemResult.PASS, f"note {response_count}", []
 
-    monkeypatch.setattr(run_module, "ask_item_response", fake_item_response)
+    stub_prompts.set_response(fake_item_response)
 
-    # Track save calls to verify auto-save behavior
+    # Track full saves and journal appends to verify auto-save behavior
+    saved_response_counts: list[int] = []
+    journaled_response_counts: list[int] = []
     original_save = run_module.SessionStore.save
+    original_append = run_module.SessionStore.append_response
 
     def tracking_save(self, session):
         saved_response_counts.append(len(session.responses))
         return original_save(self, session)
 
+    def tracking_append(self, session):
+        journaled_response_counts.append(len(session.responses))
+        return original_append(self, session)
+
     monkeypatch.setattr(run_module.SessionStore, "save", tracking_save)
+    monkeypatch.setattr(run_module.SessionStore, "append_response", tracking_append)
 
-    run_command(
+    session_path = run_command(
         checklist=checklist_path,
         output_dir=output_dir,
         no_interactive=False,
@@ -326,36 +345,31 @@ def test_run_command_autosave_after_each_response(monkeypatch, tmp_path: Path):
         resume=False,
     )
 
-    # Should have saved: once at start (0 responses), then after each of 3 responses,
-    # plus final save at the end
-    # Expected: [0, 1, 2, 3, 3] - initial save, after each response, final save
-    assert len(saved_response_counts) >= 4  # At least initial + 3 responses
-    # Verify incremental saves happened (responses grew from 0 to 3)
-    assert 0 in saved_response_counts  # Initial save with 0 responses
-    assert 1 in saved_response_counts  # After first response
-    assert 2 in saved_response_counts  # After second response
-    assert 3 in saved_response_counts  # After third response
+    # Each response is journaled; full saves happen only at start and at the end
+    assert journaled_response_counts == [1, 2, 3]
+    assert saved_response_counts == [0, 3]
+    # The final save folds the journal into the session file
+    assert not session_path.with_suffix(".ndjson").exists()
 
     # Verify final session file has all responses
-    # Filter out session-index.json which is also created by SessionStore
-    session_files = [f for f in output_dir.glob("session-*.json") if f.name != "session-index.json"]
-    assert len(session_files) == 1
-    session = decode_session(session_files[0].read_bytes())
+    session = decode_session(read_file(session_path))
     assert len(session.responses) == 3
 
 
-def test_run_command_keyboard_interrupt_saves_session(monkeypatch, tmp_path: Path):
+def test_run_command_keyboard_interrupt_saves_session(
+    stub_prompts,
+    tmp_path: Path,
+    multi_item_checklist_path: Path,
+    read_file,
+):
     """Verify Ctrl+C gracefully saves session and exits cleanly."""
     from tick.core.models.session import decode_session
 
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_multi_item_checklist(checklist_path)
+    checklist_path = _stage(multi_item_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
 
     response_count = 0
 
-    monkeypatch.setattr(run_module, "ask_variables", lambda variables, console: {})
-
     def fake_item_response_with_interrupt(*args, **kwargs):
         nonlocal response_count
         response_count += 1
@@ -363,7 +377,7 @@ def test_run_command_keyboard_interrupt_saves_session(monkeypatch, tmp_path: Pat
             raise KeyboardInterrupt
         return ItemResult.PASS, f"note {response_count}", []
 
-    monkeypatch.setattr(run_module, "ask_item_response", fake_item_response_with_interrupt)
+    stub_prompts.set_response(fake_item_response_with_interrupt)
 
     with pytest.raises(typer.Exit) as excinfo:
         run_command(
@@ -380,7 +394,7 @@ def test_run_command_keyboard_interrupt_saves_session(monkeypatch, tmp_path: Pat
     # Verify session was saved with partial progress
     session_files = [f for f in output_dir.glob("session-*.json") if f.name != "session-index.json"]
     assert len(session_files) == 1
-    session = decode_session(session_files[0].read_bytes())
+    session = decode_session(read_file(session_files[0]))
     # Should have 1 response (interrupted on 2nd)
     assert len(session.responses) == 1
     # Session should still be in progress (not completed)
@@ -389,18 +403,20 @@ def test_run_command_keyboard_interrupt_saves_session(monkeypatch, tmp_path: Pat
     assert session.status == SessionStatus.IN_PROGRESS
 
 
-def test_run_command_back_navigation(monkeypatch, tmp_path: Path):
+def test_run_command_back_navigation(
+    stub_prompts,
+    tmp_path: Path,
+    multi_item_checklist_path: Path,
+    read_file,
+):
     """Verify back navigation allows user to change previous responses."""
     from tick.core.models.session import decode_session
 
-    checklist_path = tmp_path / "checklist.yaml"
-    _write_multi_item_checklist(checklist_path)
+    checklist_path = _stage(multi_item_checklist_path, tmp_path)
     output_dir = tmp_path / "reports"
 
     call_count = 0
 
-    monkeypatch.setattr(run_module, "ask_variables", lambda variables, console: {})
-
     def fake_item_response_with_back(item, console, can_go_back=False):
         nonlocal call_count
         call_count += 1
@@ -417,9 +433,9 @@ def test_run_command_back_navigation(monkeypatch, tmp_path: Path):
         # call_count == 5
         return ItemResult.PASS, "third", []
 
-    monkeypatch.setattr(run_module, "ask_item_response", fake_item_response_with_back)
+    stub_prompts.set_response(fake_item_response_with_back)
 
-    run_command(
+    session_path = run_command(
         checklist=checklist_path,
         output_dir=output_dir,
         no_interactive=False,
@@ -428,9 +444,7 @@ def test_run_command_back_navigation(monkeypatch, tmp_path: Path):
     )
 
     # Verify final session
-    session_files = [f for f in output_dir.glob("session-*.json") if f.name != "session-index.json"]
-    assert len(session_files) == 1
-    session = decode_session(session_files[0].read_bytes())
+    session = decode_session(read_file(session_path))
     assert len(session.responses) == 3
 
     # Verify the second response was corrected
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from datetime import UTC, datetime
 
 from rich.console import Console
@@ -14,6 +15,11 @@ from tick.core.models.session import Response, Session
 from tick.core.state import ResolvedItem
 
 
+def _headless_console(buffer: io.StringIO | None = None) -> Console:
+    """Console that renders plain text into memory instead of the terminal."""
+    return Console(file=buffer if buffer is not None else io.StringIO(), width=80, no_color=True)
+
+
 def test_ask_variables_with_required_and_options(monkeypatch):
     responses = ["", "dev", "on"]
 
@@ -29,7 +35,7 @@ def test_ask_variables_with_required_and_options(monkeypatch):
         ),
         "feature_flag": ChecklistVariable(prompt="Feature", default="on"),
     }
-    console = Console()
+    console = _headless_console()
     result = ask_variables(variables, console)
     assert result["environment"] == "dev"
     assert result["feature_flag"] == "on"
@@ -46,7 +52,7 @@ def test_ask_item_response_collects_evidence(monkeypatch):
 
     item = ChecklistItem(id="item-1", check="Check login", guidance="Try invalid user")
     resolved = ResolvedItem(section_name="Auth", item=item)
-    console = Console()
+    console = _headless_console()
     result, notes, evidence = ask_item_response(resolved, console)
     assert result == ItemResult.FAIL
     assert notes == "Needs work"
@@ -58,7 +64,7 @@ def test_ask_variables_skips_none(monkeypatch):
     variables = {
         "optional": ChecklistVariable(prompt="Optional"),
     }
-    console = Console()
+    console = _headless_console()
     result = ask_variables(variables, console)
     assert "optional" not in result
 
@@ -73,7 +79,7 @@ def test_ask_variables_required_without_options(monkeypatch):
     variables = {
         "name": ChecklistVariable(prompt="Name", required=True),
     }
-    console = Console()
+    console = _headless_console()
     result = ask_variables(variables, console)
     assert result["name"] == "value"
 
@@ -89,7 +95,7 @@ def test_ask_item_response_without_guidance_or_evidence(monkeypatch):
 
     item = ChecklistItem(id="item-2", check="Check logout")
     resolved = ResolvedItem(section_name="Auth", item=item)
-    console = Console()
+    console = _headless_console()
     result, notes, evidence = ask_item_response(resolved, console)
     assert result == ItemResult.PASS
     assert notes is None
@@ -107,9 +113,10 @@ def test_ask_item_response_reprompts_on_invalid(monkeypatch):
 
     item = ChecklistItem(id="item-3", check="Check profile")
     resolved = ResolvedItem(section_name="Profile", item=item)
-    console = Console(record=True)
+    buffer = io.StringIO()
+    console = _headless_console(buffer)
     result, notes, evidence = ask_item_response(resolved, console)
-    output = console.export_text()
+    output = buffer.getvalue()
     assert "Please enter one of" in output
     assert result == ItemResult.PASS
     assert notes is None
@@ -117,7 +124,8 @@ def test_ask_item_response_reprompts_on_invalid(monkeypatch):
 
 
 def test_render_summary_outputs_table():
-    console = Console(record=True)
+    buffer = io.StringIO()
+    console = _headless_console(buffer)
     session = Session(
         id="session-1",
         checklist_id="checklist-1",
@@ -134,11 +142,11 @@ def test_render_summary_outputs_table():
         variables={},
     )
     render_summary(session, console)
-    output = console.export_text()
+    output = buffer.getvalue()
     assert "Checklist Summary" in output
 
 
 def test_run_progress_creates_task():
-    console = Console()
+    console = _headless_console()
     progress = run_progress(total=3, console=console)
     assert len(progress.tasks) == 1
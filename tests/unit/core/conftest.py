@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from tick.core.models.checklist import ChecklistItem
+from tick.core.models.enums import SessionStatus
+from tick.core.models.session import Session
+from tick.core.state import ResolvedItem
+
+
+@pytest.fixture(scope="module")
+def login_item() -> ChecklistItem:
+    """Shared frozen checklist item; safe to reuse across a module."""
+    return ChecklistItem(id="item-1", check="Check login")
+
+
+@pytest.fixture(scope="module")
+def login_resolved(login_item: ChecklistItem) -> ResolvedItem:
+    return ResolvedItem(section_name="Auth", item=login_item)
+
+
+@pytest.fixture
+def fresh_session() -> Session:
+    """New in-progress session per test; responses are mutated in place."""
+    return Session(
+        id="session-1",
+        checklist_id="checklist-1.0.0",
+        checklist_path=None,
+        started_at=datetime(2024, 1, 1, tzinfo=UTC),
+        status=SessionStatus.IN_PROGRESS,
+        variables={},
+        responses=[],
+    )
@@ -20,11 +20,16 @@ class DummyLoader:
 class DummyStorage:
     def __init__(self):
         self.saved: Session | None = None
+        self.appended: list[int] = []
 
     def save(self, session: Session):
         self.saved = session
         return None
 
+    def append_response(self, session: Session):
+        self.appended.append(len(session.responses))
+        return None
+
     def load(self, session_id: str):
         return None
 
@@ -140,6 +145,20 @@ def test_engine_save_persists_session(minimal_checklist):
     assert storage.saved is not None
 
 
+def test_engine_append_response_delegates_to_storage(minimal_checklist):
+    storage = DummyStorage()
+    engine = ExecutionEngine(loader=DummyLoader(), storage=storage)
+    engine.start(minimal_checklist, variables={}, checklist_path="checklist.yaml")
+    current = engine.current_item
+    assert current is not None
+    engine.record_response(
+        item=current.item, result=ItemResult.PASS, notes=None, evidence=None, matrix_context=None
+    )
+    engine.append_response()
+    assert storage.appended == [1]
+    assert storage.saved is None
+
+
 def test_engine_go_back_returns_to_previous_item(minimal_checklist):
     """Verify go_back() returns to previous item and removes response."""
     storage = DummyStorage()
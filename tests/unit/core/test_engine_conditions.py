@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import pytest
 
-from tick.core.engine import _expand_items, _safe_eval_condition
+from tick.core import engine as engine_module
+from tick.core.engine import _compile_condition, _expand_items, _safe_eval_condition
+from tick.core.models.checklist import ChecklistDocument
 from tick.core.utils import matrix_key
 
 
@@ -36,6 +38,13 @@ def test_safe_eval_condition_invalid_expression():
         _safe_eval_condition("__import__('os')", variables)
 
 
+def test_safe_eval_condition_reuses_compiled_tree():
+    expression = "environment == 'staging'"
+    assert _safe_eval_condition(expression, {"environment": "staging"}) is True
+    assert _safe_eval_condition(expression, {"environment": "prod"}) is False
+    assert _compile_condition(expression) is _compile_condition(expression)
+
+
 def test_expand_items_respects_conditions(complex_checklist):
     items = _expand_items(complex_checklist, {"environment": "dev", "feature_flag": "on"})
     assert len(items) == 4
@@ -45,3 +54,37 @@ def test_expand_items_respects_conditions(complex_checklist):
         complex_checklist, {"environment": "dev", "feature_flag": "off"}
     )
     assert len(items_feature_off) == 3
+
+
+def test_expand_items_evaluates_each_condition_once(monkeypatch):
+    condition = "environment != 'prod'"
+    checklist = ChecklistDocument.from_raw(
+        {
+            "checklist": {
+                "name": "Shared Conditions",
+                "version": "1.0.0",
+                "domain": "web",
+                "sections": [
+                    {
+                        "name": "Section",
+                        "condition": condition,
+                        "items": [
+                            {"id": "a", "check": "A", "condition": condition},
+                            {"id": "b", "check": "B", "condition": condition},
+                        ],
+                    }
+                ],
+            }
+        }
+    ).checklist
+    calls: list[str] = []
+    original = engine_module._safe_eval_condition
+
+    def counting(expression, variables):
+        calls.append(expression)
+        return original(expression, variables)
+
+    monkeypatch.setattr(engine_module, "_safe_eval_condition", counting)
+    items = _expand_items(checklist, {"environment": "dev"})
+    assert [resolved.item.id for resolved in items] == ["a", "b"]
+    assert calls == [condition]
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
+import pytest
+from pydantic import ValidationError
+
 from tick.core.models.checklist import Checklist, ChecklistDocument, compute_checklist_digest
 from tick.core.models.enums import ItemResult, SessionStatus
 from tick.core.models.session import Response, Session, decode_session, encode_session
@@ -49,3 +52,31 @@ def test_compute_checklist_digest_is_stable(minimal_checklist):
     first = compute_checklist_digest(minimal_checklist)
     second = compute_checklist_digest(minimal_checklist)
     assert first == second
+
+
+def test_compute_checklist_digest_reuses_cached_value(monkeypatch, minimal_checklist_data):
+    checklist = ChecklistDocument.from_raw(minimal_checklist_data).checklist
+    calls = []
+    original_dump = Checklist.model_dump
+
+    def counting_dump(self, *args, **kwargs):
+        calls.append(self)
+        return original_dump(self, *args, **kwargs)
+
+    monkeypatch.setattr(Checklist, "model_dump", counting_dump)
+    first = compute_checklist_digest(checklist)
+    assert compute_checklist_digest(checklist) == first
+    assert calls == [checklist]
+
+
+def test_checklist_models_are_frozen(minimal_checklist):
+    section = minimal_checklist.sections[0]
+    targets = (
+        (minimal_checklist, "name"),
+        (minimal_checklist.metadata, "author"),
+        (section, "name"),
+        (section.items[0], "check"),
+    )
+    for model, field in targets:
+        with pytest.raises(ValidationError, match="frozen"):
+            setattr(model, field, "changed")
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from tick.adapters.loaders.yaml_loader import YamlChecklistLoader
+from tick.adapters.storage.session_store import SessionStore
 from tick.core.models.checklist import Checklist
 from tick.core.models.session import Session
 from tick.core.protocols import ChecklistLoader, Reporter, SessionStorage
@@ -19,6 +21,9 @@ class DummyStorage:
     def save(self, session: Session):
         return Path("session.json")
 
+    def append_response(self, session: Session):
+        return Path("session.ndjson")
+
     def load(self, session_id: str):
         return None
 
@@ -34,7 +39,17 @@ class DummyReporter:
         return b"ok"
 
 
-def test_protocol_runtime_checks():
-    assert isinstance(DummyLoader(), ChecklistLoader)
-    assert isinstance(DummyStorage(), SessionStorage)
-    assert isinstance(DummyReporter(), Reporter)
+def test_protocol_structural_members():
+    loader: ChecklistLoader = DummyLoader()
+    storage: SessionStorage = DummyStorage()
+    reporter: Reporter = DummyReporter()
+    assert all(hasattr(loader, name) for name in ("load", "validate"))
+    assert all(
+        hasattr(storage, name) for name in ("save", "append_response", "load", "list_sessions")
+    )
+    assert all(hasattr(reporter, name) for name in ("generate", "content_type", "file_extension"))
+
+
+def test_adapters_declare_their_protocols():
+    assert ChecklistLoader in YamlChecklistLoader.__mro__
+    assert SessionStorage in SessionStore.__mro__
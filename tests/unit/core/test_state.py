@@ -1,62 +1,63 @@
 from __future__ import annotations
 
+import re
 from datetime import UTC, datetime
 
+import pytest
+
 from tick.core.models.checklist import ChecklistItem
 from tick.core.models.enums import ItemResult, SessionStatus
-from tick.core.models.session import Response, Session
+from tick.core.models.session import Response
 from tick.core.state import EngineState, ResolvedItem
 
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+_CANNOT_GO_BACK = re.compile(re.escape("Cannot go back"))
+
+
+@pytest.fixture(scope="module")
+def single_item(login_resolved) -> tuple[ResolvedItem, ...]:
+    return (login_resolved,)
 
-def _make_session() -> Session:
-    return Session(
-        id="session-1",
-        checklist_id="checklist-1.0.0",
-        checklist_path=None,
-        started_at=datetime.now(UTC),
-        status=SessionStatus.IN_PROGRESS,
-        variables={},
-        responses=[],
+
+@pytest.fixture(scope="module")
+def two_items() -> tuple[ResolvedItem, ...]:
+    return (
+        ResolvedItem(section_name="Auth", item=ChecklistItem(id="item-1", check="First check")),
+        ResolvedItem(section_name="Auth", item=ChecklistItem(id="item-2", check="Second check")),
     )
 
 
-def test_resolved_item_display_with_matrix():
-    item = ChecklistItem(id="item-1", check="Check login")
-    resolved = ResolvedItem(section_name="Auth", item=item, matrix_context={"role": "admin"})
+def test_resolved_item_display_with_matrix(login_item):
+    resolved = ResolvedItem(section_name="Auth", item=login_item, matrix_context={"role": "admin"})
     assert resolved.display_check == "Check login (role=admin)"
 
 
-def test_engine_state_current_item_none_when_complete():
-    item = ChecklistItem(id="item-1", check="Check login")
-    resolved = ResolvedItem(section_name="Auth", item=item)
-    state = EngineState(checklist=None, session=_make_session(), items=(resolved,), current_index=1)
+def test_engine_state_current_item_none_when_complete(single_item, fresh_session):
+    state = EngineState(checklist=None, session=fresh_session, items=single_item, current_index=1)
     assert state.current_item is None
 
 
-def test_engine_state_with_response_advances():
-    item = ChecklistItem(id="item-1", check="Check login")
-    resolved = ResolvedItem(section_name="Auth", item=item)
-    state = EngineState(checklist=None, session=_make_session(), items=(resolved,))
+def test_engine_state_with_response_advances(single_item, fresh_session):
+    state = EngineState(checklist=None, session=fresh_session, items=single_item)
     response = Response(
         item_id="item-1",
         result=ItemResult.PASS,
-        answered_at=datetime.now(UTC),
+        answered_at=_FIXED_TS,
     )
     updated = state.with_response(response)
     assert len(updated.session.responses) == 1
     assert updated.current_index == 1
 
 
-def test_engine_state_with_completed_sets_status():
-    item = ChecklistItem(id="item-1", check="Check login")
-    resolved = ResolvedItem(section_name="Auth", item=item)
-    state = EngineState(checklist=None, session=_make_session(), items=(resolved,))
+def test_engine_state_with_completed_sets_status(single_item, fresh_session):
+    state = EngineState(checklist=None, session=fresh_session, items=single_item)
     completed = state.with_completed()
     assert completed.session.status == SessionStatus.COMPLETED
     assert completed.session.completed_at is not None
 
 
-def test_engine_state_session_mutation_is_intentional():
+@pytest.mark.documentation
+def test_engine_state_session_mutation_is_intentional(single_item, fresh_session):
     """Verify that Session is intentionally mutable within frozen EngineState.
 
     This test documents the design choice: EngineState is immutable (frozen)
@@ -65,16 +66,14 @@ def test_engine_state_session_mutation_is_intentional():
 
     This avoids expensive deep copies of the responses list on each transition.
     """
-    item = ChecklistItem(id="item-1", check="Check login")
-    resolved = ResolvedItem(section_name="Auth", item=item)
-    session = _make_session()
-    state = EngineState(checklist=None, session=session, items=(resolved,))
+    session = fresh_session
+    state = EngineState(checklist=None, session=session, items=single_item)
 
     # Add a response via with_response
     response = Response(
         item_id="item-1",
         result=ItemResult.PASS,
-        answered_at=datetime.now(UTC),
+        answered_at=_FIXED_TS,
     )
     updated = state.with_response(response)
 
@@ -91,20 +90,16 @@ def test_engine_state_session_mutation_is_intentional():
     # while EngineState tracks progression through items
 
 
-def test_engine_state_with_back_decrements_index():
+def test_engine_state_with_back_decrements_index(two_items, fresh_session):
     """Verify with_back returns to previous item and removes last response."""
-    item1 = ChecklistItem(id="item-1", check="First check")
-    item2 = ChecklistItem(id="item-2", check="Second check")
-    resolved1 = ResolvedItem(section_name="Auth", item=item1)
-    resolved2 = ResolvedItem(section_name="Auth", item=item2)
-    session = _make_session()
-    state = EngineState(checklist=None, session=session, items=(resolved1, resolved2))
+    session = fresh_session
+    state = EngineState(checklist=None, session=session, items=two_items)
 
     # Record first response
     response1 = Response(
         item_id="item-1",
         result=ItemResult.PASS,
-        answered_at=datetime.now(UTC),
+        answered_at=_FIXED_TS,
     )
     state = state.with_response(response1)
     assert state.current_index == 1
@@ -114,7 +109,7 @@ def test_engine_state_with_back_decrements_index():
     response2 = Response(
         item_id="item-2",
         result=ItemResult.FAIL,
-        answered_at=datetime.now(UTC),
+        answered_at=_FIXED_TS,
     )
     state = state.with_response(response2)
     assert state.current_index == 2
@@ -127,14 +122,10 @@ def test_engine_state_with_back_decrements_index():
     assert state.session.responses[0].item_id == "item-1"
 
 
-def test_engine_state_with_back_raises_at_first_item():
+def test_engine_state_with_back_raises_at_first_item(single_item, fresh_session):
     """Verify with_back raises an error when at the first item."""
-    import pytest
-
-    item = ChecklistItem(id="item-1", check="Check login")
-    resolved = ResolvedItem(section_name="Auth", item=item)
-    session = _make_session()
-    state = EngineState(checklist=None, session=session, items=(resolved,))
+    session = fresh_session
+    state = EngineState(checklist=None, session=session, items=single_item)
 
-    with pytest.raises(ValueError, match="Cannot go back"):
+    with pytest.raises(ValueError, match=_CANNOT_GO_BACK):
         state.with_back()
@@ -1,16 +1,15 @@
 import os
 
-from ruamel.yaml import YAML
-
-from tick.adapters.loaders.yaml_loader import YamlChecklistLoader
+from tick.adapters.loaders.yaml_loader import YamlChecklistLoader, safe_yaml
 from tick.core.cache import ChecklistCache
 from tick.core.engine import _expand_items
 
+_yaml = safe_yaml()
+
 
 def _write_yaml(path, data: dict[str, object]) -> None:
-    yaml = YAML()
     with path.open("w", encoding="utf-8") as handle:
-        yaml.dump(data, handle)
+        _yaml.dump(data, handle)
 
 
 def test_checklist_cache_roundtrip(tmp_path, minimal_checklist_data):
@@ -38,14 +37,29 @@ def test_checklist_cache_invalidation(tmp_path, minimal_checklist_data):
     stats = cache.stats()
     assert stats.checklist_entries == 1
 
-    modified = {**minimal_checklist_data}
-    modified["checklist"] = {**modified["checklist"], "version": "1.0.1"}
+    modified = minimal_checklist_data.copy()
+    inner = modified["checklist"].copy()
+    inner["version"] = "1.0.1"
+    modified["checklist"] = inner
     _write_yaml(checklist_path, modified)
     loader.load(checklist_path)
     stats_after = cache.stats()
     assert stats_after.checklist_entries == 2
 
 
+def test_checklist_cache_shares_entry_for_identical_content(tmp_path, minimal_checklist_data):
+    first_path = tmp_path / "first.yaml"
+    second_path = tmp_path / "second.yaml"
+    _write_yaml(first_path, minimal_checklist_data)
+    _write_yaml(second_path, minimal_checklist_data)
+    cache = ChecklistCache(tmp_path / "cache")
+    loader = YamlChecklistLoader(cache=cache)
+
+    loader.load(first_path)
+    loader.load(second_path)
+    assert cache.stats().checklist_entries == 1
+
+
 def test_expansion_cache_roundtrip(minimal_checklist, tmp_path):
     cache = ChecklistCache(tmp_path / "cache")
     variables: dict[str, object] = {}
@@ -66,12 +80,28 @@ def test_cache_prune_removes_old_entries(tmp_path, minimal_checklist_data):
     loader = YamlChecklistLoader(cache=cache)
     loader.load(checklist_path)
 
-    entries = list((tmp_path / "cache" / "checklists").glob("*.json"))
-    assert entries
-    old_mtime = 1
-    for entry in entries:
-        os.utime(entry, (old_mtime, old_mtime))
+    checklists_dir = tmp_path / "cache" / "checklists"
+    names = [path.name for path in checklists_dir.glob("*.json")]
+    assert names
+    dir_fd = os.open(checklists_dir, os.O_RDONLY)
+    try:
+        for name in names:
+            os.utime(name, ns=(1_000_000_000, 1_000_000_000), dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
 
     cache.prune(max_age_days=1)
     stats = cache.stats()
     assert stats.checklist_entries == 0
+
+
+def test_cache_stats_tolerates_missing_directory(tmp_path, minimal_checklist_data):
+    checklist_path = tmp_path / "checklist.yaml"
+    _write_yaml(checklist_path, minimal_checklist_data)
+    cache = ChecklistCache(tmp_path / "cache")
+    YamlChecklistLoader(cache=cache).load(checklist_path)
+    (tmp_path / "cache" / "expansions").rmdir()
+
+    stats = cache.stats()
+    assert (stats.checklist_entries, stats.expansion_entries) == (1, 0)
+    assert stats.total_bytes > 0
@@ -1,18 +1,17 @@
 from tick.core import perf
-from tick.core.perf import PerfResult, run_harness
+from tick.core.perf import PerfResult
 
 
-def test_perf_harness_runs(large_checklist_path):
-    result = run_harness(large_checklist_path)
+def test_perf_harness_runs(harness_result):
+    result = harness_result
 
-    assert isinstance(result, PerfResult)
+    assert type(result) is PerfResult
     assert result.items > 0
     assert result.validate_seconds >= 0
     assert result.expand_seconds >= 0
     assert result.report_seconds >= 0
 
 
-def test_perf_harness_formatting(large_checklist_path):
-    result = run_harness(large_checklist_path)
-    output = perf._format_result(result)
+def test_perf_harness_formatting(harness_result):
+    output = perf._format_result(harness_result)
     assert "validate_seconds" in output
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 import typer
 
+from tick.core import telemetry as telemetry_module
 from tick.core.telemetry import (
     get_telemetry_state,
     record_event,
@@ -12,16 +15,33 @@ from tick.core.telemetry import (
 )
 
 
-def test_telemetry_disabled_by_default(tmp_path, monkeypatch):
+class _BoomError(Exception):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _isolated_xdg(tmp_path, monkeypatch) -> None:
+    """Keep telemetry off the developer's real config directory."""
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+
+@pytest.fixture
+def memory_files(monkeypatch) -> dict[Path, bytes]:
+    """Keep telemetry config and state in a dict instead of on disk."""
+    files: dict[Path, bytes] = {}
+    monkeypatch.setattr(telemetry_module, "_read_bytes", files.get)
+    monkeypatch.setattr(telemetry_module, "_write_bytes", files.__setitem__)
+    return files
+
+
+def test_telemetry_disabled_by_default(memory_files):
     assert telemetry_enabled() is False
     record_event("run", 0.2, None)
     state = get_telemetry_state()
     assert state.commands == {}
 
 
-def test_telemetry_records_events(tmp_path, monkeypatch):
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+def test_telemetry_records_events(memory_files):
     set_telemetry_enabled(True)
     record_event("run", 0.2, None)
     record_event("run", 0.6, "ValueError")
@@ -30,11 +50,41 @@ def test_telemetry_records_events(tmp_path, monkeypatch):
     assert state.errors["ValueError"] == 1
 
 
-def test_telemetry_context_records_errors(tmp_path, monkeypatch):
-    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+def test_telemetry_context_records_errors(memory_files):
     set_telemetry_enabled(True)
-    with pytest.raises(typer.Exit), telemetry_context("validate"):
-        raise typer.Exit(code=1)
+    with pytest.raises(_BoomError), telemetry_context("validate"):
+        raise _BoomError
     state = get_telemetry_state()
     assert state.commands["validate"] == 1
-    assert state.errors["typer.Exit"] == 1
+    assert state.errors["_BoomError"] == 1
+
+
+@pytest.mark.parametrize(
+    ("exit_code", "expected_errors"),
+    [(1, {"typer.Exit": 1}), (0, {})],
+    ids=["nonzero-exit", "clean-exit"],
+)
+def test_telemetry_context_labels_typer_exit(memory_files, exit_code, expected_errors):
+    set_telemetry_enabled(True)
+    with pytest.raises(typer.Exit), telemetry_context("run"):
+        raise typer.Exit(code=exit_code)
+    state = get_telemetry_state()
+    assert state.commands["run"] == 1
+    assert state.errors == expected_errors
+
+
+def test_telemetry_persists_to_config_dir(tmp_path):
+    set_telemetry_enabled(True)
+    record_event("report", 1.5, None)
+    assert (tmp_path / "tick" / "telemetry.json").is_file()
+    assert get_telemetry_state().commands == {"report": 1}
+    (tmp_path / "tick" / "telemetry-state.json").write_bytes(b"not-json")
+    assert get_telemetry_state().commands == {}
+
+
+def test_telemetry_write_ignores_unwritable_config_dir(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_bytes(b"")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(blocker))
+    set_telemetry_enabled(True)
+    assert telemetry_enabled() is False